@@ -2,22 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+from typing import Any, Optional, Union
 
 import httpx
+import orjson
+
+from . import queries
 
 API_URL = "https://api.opencollective.com/graphql/v2"
 DEFAULT_TIMEOUT = 30.0
+# Fail fast on an unreachable API instead of waiting the full DEFAULT_TIMEOUT
+CONNECT_TIMEOUT = 5.0
+# Agents call tools seconds to minutes apart; httpx's 5 s default would drop
+# the pooled connection, and its TLS session, between most calls
+KEEPALIVE_EXPIRY = 120.0
+
+# Automatic Persisted Query errors as (extensions.code, message)
+PERSISTED_QUERY_NOT_FOUND = ("PERSISTED_QUERY_NOT_FOUND", "PersistedQueryNotFound")
+PERSISTED_QUERY_NOT_SUPPORTED = (
+    "PERSISTED_QUERY_NOT_SUPPORTED",
+    "PersistedQueryNotSupported",
+)
 
 
 class OpenCollectiveClient:
     """Async GraphQL client for the OpenCollective API v2.
 
     Supports both authenticated (personal token) and unauthenticated requests.
+
+    Uses Automatic Persisted Queries: each operation is first sent as its
+    SHA-256 hash only, and the full query is sent once if the server has not
+    cached it yet. APQ is switched off for the session if the server does
+    not support it.
+
+    execute_many() sends several operations in one HTTP request using
+    array-form GraphQL batching, falling back to separate requests if the
+    server rejects batches.
     """
 
-    def __init__(self, personal_token: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        personal_token: Optional[str] = None,
+        persisted_queries: bool = True,
+    ) -> None:
         self.personal_token = personal_token
+        self.persisted_queries = persisted_queries
+        self.batching = True
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "OpenCollectiveClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
 
     def _headers(self) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
@@ -25,6 +63,27 @@ class OpenCollectiveClient:
             headers["Personal-Token"] = self.personal_token
         return headers
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=CONNECT_TIMEOUT),
+                headers=self._headers(),
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+                http2=True,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
     async def execute(
         self,
         query: str,
@@ -38,20 +97,178 @@ class OpenCollectiveClient:
         if variables:
             payload["variables"] = variables
 
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.post(
-                API_URL,
-                headers=self._headers(),
-                json=payload,
+        client = await self._get_client()
+
+        if self.persisted_queries:
+            extensions = {
+                "persistedQuery": {
+                    "version": 1,
+                    "sha256Hash": queries.persisted_query_hash(query),
+                }
+            }
+            # Fast path: send only the hash of a query the server has cached
+            hashed = {k: v for k, v in payload.items() if k != "query"}
+            result = await self._post(
+                client, {**hashed, "extensions": extensions}, hash_only=True
+            )
+            if result is None:
+                # Refused for another reason: either the server has no APQ
+                # support or the request itself is bad (e.g. its variables).
+                # The full query tells which; only its success disables APQ.
+                result = await self._post(client, payload)
+                assert result is not None
+                data = self._unwrap(result)
+                self.persisted_queries = False
+                return data
+            if _has_apq_error(result, PERSISTED_QUERY_NOT_FOUND):
+                # Register the query under its hash while executing it
+                payload["extensions"] = extensions
+            elif _has_apq_error(result, PERSISTED_QUERY_NOT_SUPPORTED):
+                # The server can't serve queries by hash; stop trying
+                self.persisted_queries = False
+            else:
+                return self._unwrap(result)
+
+        result = await self._post(client, payload)
+        assert result is not None
+        return self._unwrap(result)
+
+    async def execute_many(
+        self,
+        operations: list[tuple[str, Optional[dict[str, Any]]]],
+    ) -> list[Union[dict[str, Any], Exception]]:
+        """Execute several queries in a single HTTP request.
+
+        Batched operations are sent as full queries, without APQ hashes.
+
+        Returns:
+            One entry per operation, in order: its data, or the exception it
+            failed with (GraphQLError for GraphQL errors).
+        """
+        if self.batching and len(operations) > 1:
+            payload = []
+            for query, variables in operations:
+                operation: dict[str, Any] = {"query": query}
+                if variables:
+                    operation["variables"] = variables
+                payload.append(operation)
+
+            client = await self._get_client()
+            async with client.stream(
+                "POST", API_URL, content=orjson.dumps(payload)
+            ) as response:
+                # Servers without batching refuse a JSON array with HTTP 400
+                if response.status_code != 400:
+                    response.raise_for_status()
+                    results = orjson.loads(await response.aread())
+                else:
+                    results = None
+
+            if isinstance(results, list) and len(results) == len(operations):
+                unwrapped: list[Union[dict[str, Any], Exception]] = []
+                for result in results:
+                    try:
+                        unwrapped.append(self._unwrap(result))
+                    except GraphQLError as e:
+                        unwrapped.append(e)
+                return unwrapped
+            # Not a batch response; stop batching for the session
+            self.batching = False
+
+        outcomes = await asyncio.gather(
+            *(self.execute(query, variables) for query, variables in operations),
+            return_exceptions=True,
+        )
+        fallback: list[Union[dict[str, Any], Exception]] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(
+                outcome, Exception
+            ):
+                raise outcome  # Cancellation and the like are not results
+            fallback.append(outcome)
+        return fallback
+
+    async def execute_raw(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]] = None,
+    ) -> bytes:
+        """Execute a GraphQL operation and return the response body as is.
+
+        For forwarding a response without parsing and re-encoding it. GraphQL
+        errors are not raised; they are part of the returned body. Raises on
+        HTTP errors other than a JSON 400, and on a body that isn't JSON.
+        """
+        payload: dict[str, Any] = {"query": query}
+        if variables:
+            payload["variables"] = variables
+
+        client = await self._get_client()
+        response = await client.post(API_URL, content=orjson.dumps(payload))
+        # Also matches application/graphql-response+json
+        is_json = "json" in response.headers.get("content-type", "")
+        # A JSON 400 carries the GraphQL validation errors, worth returning;
+        # anything else (e.g. a proxy's HTML error page) is an HTTP error
+        if response.status_code != 400 or not is_json:
+            response.raise_for_status()
+        if not is_json:
+            raise ValueError(
+                "Unexpected non-JSON response "
+                f"({response.headers.get('content-type', 'no content type')})"
             )
+        return response.content
+
+    async def _post(
+        self,
+        client: httpx.AsyncClient,
+        payload: dict[str, Any],
+        hash_only: bool = False,
+    ) -> Optional[dict[str, Any]]:
+        """POST a GraphQL payload and decode the JSON response.
+
+        A hash-only request refused with HTTP 400 returns its GraphQL result
+        if that is an APQ error (unknown hash, or APQ not supported), and
+        None for any other 400, such as "Must provide query string." from a
+        server without APQ or an error in the request's variables.
+        """
+        # Encode/decode with orjson; the Content-Type header is set on the client.
+        # Stream so HTTP errors raise before their body is downloaded.
+        async with client.stream(
+            "POST", API_URL, content=orjson.dumps(payload)
+        ) as response:
+            if hash_only and response.status_code == 400:
+                try:
+                    result = orjson.loads(await response.aread())
+                except orjson.JSONDecodeError:
+                    return None
+                if isinstance(result, dict) and (
+                    _has_apq_error(result, PERSISTED_QUERY_NOT_FOUND)
+                    or _has_apq_error(result, PERSISTED_QUERY_NOT_SUPPORTED)
+                ):
+                    return result
+                return None
             response.raise_for_status()
-            result = response.json()
+            return orjson.loads(await response.aread())
+
+    @staticmethod
+    def _unwrap(result: dict[str, Any]) -> dict[str, Any]:
+        """Return the data of a GraphQL result, raising on GraphQL errors."""
+        errors = result.get("errors")
+        if errors:
+            msgs = "; ".join(e.get("message", str(e)) for e in errors)
+            raise GraphQLError(msgs, errors)
+
+        return result.get("data") or {}
 
-        if "errors" in result:
-            msgs = "; ".join(e.get("message", str(e)) for e in result["errors"])
-            raise GraphQLError(msgs, result["errors"])
 
-        return result.get("data", {})
+def _has_apq_error(result: dict[str, Any], apq_error: tuple[str, str]) -> bool:
+    """Check whether a GraphQL result contains the given APQ error."""
+    code, message = apq_error
+    return any(
+        (error.get("extensions") or {}).get("code") == code
+        or error.get("message") == message
+        for error in result.get("errors") or []
+    )
 
 
 class GraphQLError(Exception):
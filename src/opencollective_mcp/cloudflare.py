@@ -8,12 +8,48 @@ Requires CLOUDFLARE_API_TOKEN environment variable with Billing Read permission.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
-from datetime import datetime
+import sqlite3
+import threading
+import time
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Optional
 
 import httpx
+import orjson
+
+# Bulk invoice conversion fans out one Frankfurter call per item, so keep the
+# pool wide enough that requests don't queue on connection acquisition.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=1000, max_keepalive_connections=100, keepalive_expiry=60.0
+)
+
+# How long listed invoices stay valid for get_invoice lookups (seconds)
+INVOICE_INDEX_TTL = 60.0
+
+# On-disk exchange rate cache shared across processes
+FX_CACHE_PATH = Path.home() / ".cache" / "opencollective-mcp" / "fx.db"
+
+RateKey = tuple[str, str, str]  # (date, from_currency, to_currency)
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _normalize_date(date: str) -> str:
+    """Reduce an ISO date or datetime string to YYYY-MM-DD."""
+    # Fast path: the string already starts with the calendar date
+    if _ISO_DATE.match(date) or "T" not in date:
+        return date[:10]
+    try:
+        date_obj = datetime.fromisoformat(date.replace("Z", "+00:00"))
+        return date_obj.strftime("%Y-%m-%d")
+    except ValueError:
+        return date[:10]
 
 
 class ExchangeRateClient:
@@ -25,20 +61,97 @@ class ExchangeRateClient:
 
     BASE_URL = "https://api.frankfurter.app"
 
-    def __init__(self) -> None:
+    def __init__(self, cache_path: Optional[Path] = FX_CACHE_PATH) -> None:
+        """Initialize the exchange rate client.
+
+        Args:
+            cache_path: SQLite file for persisting historical rates across
+                       runs. Pass None to keep rates in memory only.
+        """
         self._client: Optional[httpx.AsyncClient] = None
+        # Historical rates never change, keyed by (date, from, to)
+        self._rate_cache: dict[RateKey, float] = {}
+        self._cache_path = cache_path
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = httpx.AsyncClient(
+                timeout=30.0, limits=HTTP_LIMITS, http2=True
+            )
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and the rate cache database."""
         if self._client:
             await self._client.aclose()
             self._client = None
+        with self._db_lock:
+            if self._db:
+                self._db.close()
+                self._db = None
+
+    def _open_db(self) -> Optional[sqlite3.Connection]:
+        """Open the rate cache database. Caller must hold _db_lock."""
+        if self._db is None and self._cache_path is not None:
+            try:
+                self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(self._cache_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS fx ("
+                    "date TEXT, src TEXT, dst TEXT, rate REAL, "
+                    "PRIMARY KEY (date, src, dst))"
+                )
+            except (OSError, sqlite3.Error):
+                # Unusable cache location: fall back to memory-only caching
+                self._cache_path = None
+                self._db = None
+        return self._db
+
+    def _load_rates(self, keys: list[RateKey]) -> dict[RateKey, float]:
+        """Look up rates in the on-disk cache (blocking)."""
+        found: dict[RateKey, float] = {}
+        with self._db_lock:
+            db = self._open_db()
+            if db is None:
+                return found
+            try:
+                for key in keys:
+                    row = db.execute(
+                        "SELECT rate FROM fx WHERE date = ? AND src = ? AND dst = ?",
+                        key,
+                    ).fetchone()
+                    if row:
+                        found[key] = row[0]
+            except sqlite3.Error:
+                pass
+        return found
+
+    def _store_rates(self, rates: dict[RateKey, float]) -> None:
+        """Persist rates to the on-disk cache (blocking).
+
+        Only dates strictly in the past are stored; today's rate may not be
+        published yet and the API would answer with the previous day's.
+        """
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        rows = [(*key, rate) for key, rate in rates.items() if key[0] < today]
+        if not rows:
+            return
+        with self._db_lock:
+            db = self._open_db()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO fx (date, src, dst, rate) "
+                        "VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+            except sqlite3.Error:
+                pass
 
     async def get_rate(
         self, date: str, from_currency: str = "USD", to_currency: str = "EUR"
@@ -53,15 +166,23 @@ class ExchangeRateClient:
         Returns:
             Exchange rate as float
         """
-        # Parse date to extract just the date part
-        try:
-            if "T" in date:
-                date_obj = datetime.fromisoformat(date.replace("Z", "+00:00"))
-                date_str = date_obj.strftime("%Y-%m-%d")
-            else:
-                date_str = date[:10]  # Take first 10 chars (YYYY-MM-DD)
-        except (ValueError, IndexError):
-            date_str = date[:10] if len(date) >= 10 else date
+        return await self._get_rate_normalized(
+            _normalize_date(date), from_currency, to_currency
+        )
+
+    async def _get_rate_normalized(
+        self, date_str: str, from_currency: str, to_currency: str
+    ) -> float:
+        """Get exchange rate for an already normalized YYYY-MM-DD date."""
+        cache_key = (date_str, from_currency.upper(), to_currency.upper())
+        cached = self._rate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        stored = await asyncio.to_thread(self._load_rates, [cache_key])
+        if cache_key in stored:
+            self._rate_cache[cache_key] = stored[cache_key]
+            return stored[cache_key]
 
         client = await self._get_client()
         url = f"{self.BASE_URL}/{date_str}"
@@ -72,7 +193,7 @@ class ExchangeRateClient:
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         rates = data.get("rates", {})
         rate = rates.get(to_currency.upper())
 
@@ -81,8 +202,88 @@ class ExchangeRateClient:
                 f"No exchange rate found for {to_currency} on {date_str}"
             )
 
+        self._rate_cache[cache_key] = float(rate)
+        await asyncio.to_thread(self._store_rates, {cache_key: float(rate)})
         return float(rate)
 
+    async def get_rates_range(
+        self,
+        start: str,
+        end: str,
+        from_currency: str = "USD",
+        to_currency: str = "EUR",
+    ) -> dict[str, float]:
+        """Get daily exchange rates for a date range in a single request.
+
+        Args:
+            start: First date of the range (YYYY-MM-DD)
+            end: Last date of the range (YYYY-MM-DD)
+            from_currency: Source currency code (default: USD)
+            to_currency: Target currency code (default: EUR)
+
+        Returns:
+            Dict mapping each published date (YYYY-MM-DD) to its rate.
+            Weekends and holidays have no entry.
+        """
+        client = await self._get_client()
+        url = f"{self.BASE_URL}/{start}..{end}"
+
+        response = await client.get(
+            url,
+            params={"from": from_currency.upper(), "to": to_currency.upper()},
+        )
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        rates: dict[str, float] = {}
+        for day, day_rates in data.get("rates", {}).items():
+            rate = day_rates.get(to_currency.upper())
+            if rate is not None:
+                rates[day] = float(rate)
+        return rates
+
+    async def prefetch_rates(
+        self,
+        dates: Iterable[str],
+        from_currency: str = "USD",
+        to_currency: str = "EUR",
+    ) -> None:
+        """Warm the rate cache for many dates with one time-series request.
+
+        Dates without a published rate (weekends, holidays) get the nearest
+        prior business-day rate, which is what a single-date query returns.
+
+        Args:
+            dates: Dates in YYYY-MM-DD format
+            from_currency: Source currency code (default: USD)
+            to_currency: Target currency code (default: EUR)
+        """
+        src, dst = from_currency.upper(), to_currency.upper()
+        missing = sorted(
+            {d for d in dates if d and (d, src, dst) not in self._rate_cache}
+        )
+        if not missing:
+            return
+
+        stored = await asyncio.to_thread(
+            self._load_rates, [(d, src, dst) for d in missing]
+        )
+        self._rate_cache.update(stored)
+        missing = [d for d in missing if (d, src, dst) not in stored]
+        if not missing:
+            return
+
+        rates = await self.get_rates_range(missing[0], missing[-1], src, dst)
+        published = sorted(rates)
+
+        fetched: dict[RateKey, float] = {}
+        for day in missing:
+            idx = bisect_right(published, day)
+            if idx:
+                fetched[(day, src, dst)] = rates[published[idx - 1]]
+        self._rate_cache.update(fetched)
+        await asyncio.to_thread(self._store_rates, fetched)
+
     async def convert(
         self,
         amount: float,
@@ -99,31 +300,45 @@ class ExchangeRateClient:
             to_currency: Target currency
 
         Returns:
-            Dict with converted amount, rate, and metadata
+            Dict with converted amount (and in cents), rate, and metadata
         """
-        rate = await self.get_rate(date, from_currency, to_currency)
-        converted_amount = amount * rate
-
-        # Parse date for return
-        try:
-            if "T" in date:
-                date_obj = datetime.fromisoformat(date.replace("Z", "+00:00"))
-                date_str = date_obj.strftime("%Y-%m-%d")
-            else:
-                date_str = date[:10]
-        except (ValueError, IndexError):
-            date_str = date[:10] if len(date) >= 10 else date
+        date_str = _normalize_date(date)
+        rate = await self._get_rate_normalized(date_str, from_currency, to_currency)
+        # Round once to whole cents so callers never re-scale a rounded float
+        converted_cents = int(round(amount * rate * 100))
 
         return {
             "original_amount": amount,
             "original_currency": from_currency.upper(),
-            "converted_amount": round(converted_amount, 2),
+            "converted_amount": converted_cents / 100,
+            "converted_cents": converted_cents,
             "converted_currency": to_currency.upper(),
             "exchange_rate": rate,
             "rate_date": date_str,
         }
 
 
+# Process-wide exchange rate client so every CloudflareClient shares one
+# connection pool and one rate cache
+_SHARED_FX: Optional[ExchangeRateClient] = None
+
+
+def _shared_exchange_client() -> ExchangeRateClient:
+    """Get or create the process-wide exchange rate client."""
+    global _SHARED_FX
+    if _SHARED_FX is None:
+        _SHARED_FX = ExchangeRateClient()
+    return _SHARED_FX
+
+
+async def close_shared_exchange_client() -> None:
+    """Close the process-wide exchange rate client, if one was created."""
+    global _SHARED_FX
+    if _SHARED_FX is not None:
+        await _SHARED_FX.close()
+        _SHARED_FX = None
+
+
 class CloudflareClient:
     """Client for fetching Cloudflare billing data via API.
 
@@ -138,7 +353,10 @@ class CloudflareClient:
     BASE_URL = "https://api.cloudflare.com/client/v4"
 
     def __init__(
-        self, api_token: Optional[str] = None, convert_to_eur: bool = True
+        self,
+        api_token: Optional[str] = None,
+        convert_to_eur: bool = True,
+        exchange_client: Optional[ExchangeRateClient] = None,
     ) -> None:
         """Initialize the Cloudflare client.
 
@@ -147,13 +365,18 @@ class CloudflareClient:
                       If not provided, uses CLOUDFLARE_API_TOKEN env var.
             convert_to_eur: Whether to automatically convert USD amounts to EUR
                            using historical exchange rates (default: True)
+            exchange_client: Exchange rate client to use. Defaults to the
+                            process-wide shared client. The caller owns it;
+                            close() does not close it.
         """
         self._api_token = api_token or os.environ.get("CLOUDFLARE_API_TOKEN")
         if not self._api_token:
             raise ValueError("CLOUDFLARE_API_TOKEN environment variable must be set")
         self._client: Optional[httpx.AsyncClient] = None
-        self._exchange_client: Optional[ExchangeRateClient] = None
+        self._exchange_client = exchange_client
         self._convert_to_eur = convert_to_eur
+        # invoice id -> (time listed, invoice), filled by list_invoices
+        self._invoice_index: dict[str, tuple[float, dict[str, Any]]] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
@@ -164,22 +387,24 @@ class CloudflareClient:
                     "Content-Type": "application/json",
                 },
                 timeout=30.0,
+                limits=HTTP_LIMITS,
+                http2=True,
             )
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP clients."""
+        """Close the HTTP client.
+
+        The exchange rate client is shared (or caller-owned) and stays open.
+        """
         if self._client:
             await self._client.aclose()
             self._client = None
-        if self._exchange_client:
-            await self._exchange_client.close()
-            self._exchange_client = None
 
     async def _get_exchange_client(self) -> ExchangeRateClient:
-        """Get or create the exchange rate client."""
+        """Get the exchange rate client, defaulting to the shared one."""
         if self._exchange_client is None:
-            self._exchange_client = ExchangeRateClient()
+            self._exchange_client = _shared_exchange_client()
         return self._exchange_client
 
     async def _request(
@@ -192,7 +417,7 @@ class CloudflareClient:
         response = await client.request(method, url, params=params)
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         if not data.get("success"):
             errors = data.get("errors", [])
             error_msg = (
@@ -245,28 +470,33 @@ class CloudflareClient:
                 "description": item.get("description") or "Cloudflare services",
                 "action": item.get("action"),
             }
+            invoices.append(invoice_data)
 
-            # Convert to EUR if enabled and currency is USD
-            if self._convert_to_eur and currency.upper() == "USD":
-                try:
-                    exchange_client = await self._get_exchange_client()
-                    conversion = await exchange_client.convert(
-                        amount=float(amount),
-                        date=item.get("occurred_at", ""),
-                        from_currency="USD",
-                        to_currency="EUR",
-                    )
-                    invoice_data["amount_eur"] = str(conversion["converted_amount"])
-                    invoice_data["amount_cents_eur"] = int(
-                        conversion["converted_amount"] * 100
-                    )
-                    invoice_data["exchange_rate"] = conversion["exchange_rate"]
-                    invoice_data["rate_date"] = conversion["rate_date"]
-                except Exception:
-                    # If conversion fails, continue without EUR data
-                    pass
+        # Convert to EUR if enabled and currency is USD
+        usd_invoices = [inv for inv in invoices if inv["currency"] == "USD"]
+        if self._convert_to_eur and usd_invoices:
+            exchange_client = await self._get_exchange_client()
+
+            # Warm the rate cache for the whole date window in one request so
+            # the per-invoice conversions below don't hit the network
+            dates = {(inv["date"] or "")[:10] for inv in usd_invoices}
+            try:
+                await exchange_client.prefetch_rates(dates, "USD", "EUR")
+            except Exception:
+                # Fall back to fetching each distinct date concurrently
+                await asyncio.gather(
+                    *(exchange_client.get_rate(d, "USD", "EUR") for d in dates),
+                    return_exceptions=True,
+                )
+
+            conversions = await asyncio.gather(
+                *(self._convert_one(exchange_client, inv) for inv in usd_invoices)
+            )
+            for invoice_data, conversion in zip(usd_invoices, conversions):
+                invoice_data.update(conversion)
 
-            invoices.append(invoice_data)
+        now = time.monotonic()
+        self._invoice_index.update((inv["id"], (now, inv)) for inv in invoices)
 
         return {
             "invoices": invoices,
@@ -277,6 +507,30 @@ class CloudflareClient:
             },
         }
 
+    async def _convert_one(
+        self, exchange_client: ExchangeRateClient, invoice_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Convert one USD invoice to EUR fields to merge into the invoice.
+
+        Returns an empty dict if the conversion fails, so the invoice is
+        kept without EUR data.
+        """
+        try:
+            conversion = await exchange_client.convert(
+                amount=float(invoice_data["amount"]),
+                date=invoice_data["date"] or "",
+                from_currency="USD",
+                to_currency="EUR",
+            )
+        except Exception:
+            return {}
+        return {
+            "amount_eur": str(conversion["converted_amount"]),
+            "amount_cents_eur": conversion["converted_cents"],
+            "exchange_rate": conversion["exchange_rate"],
+            "rate_date": conversion["rate_date"],
+        }
+
     def _parse_amount(self, amount_str: str) -> tuple[str, str]:
         """Parse amount string like '3.45 usd' into (amount, currency).
 
@@ -296,6 +550,13 @@ class CloudflareClient:
             return match.group(1), "USD"
         return amount_str, "USD"
 
+    def _get_indexed_invoice(self, invoice_id: str) -> Optional[dict[str, Any]]:
+        """Return a recently listed invoice, or None if absent or expired."""
+        cached = self._invoice_index.get(invoice_id)
+        if cached and time.monotonic() - cached[0] < INVOICE_INDEX_TTL:
+            return cached[1]
+        return None
+
     async def get_invoice(self, invoice_id: str) -> dict[str, Any]:
         """Get a specific billing item by ID.
 
@@ -305,13 +566,17 @@ class CloudflareClient:
         Returns:
             Dict with invoice details
         """
+        invoice = self._get_indexed_invoice(invoice_id)
+        if invoice is not None:
+            return invoice
+
         # The API doesn't support getting a single item by ID directly,
-        # so we fetch all and filter
-        data = await self.list_invoices(per_page=100)
+        # so we fetch all and look it up in the refreshed index
+        await self.list_invoices(per_page=100)
 
-        for invoice in data["invoices"]:
-            if invoice["id"] == invoice_id:
-                return invoice
+        invoice = self._get_indexed_invoice(invoice_id)
+        if invoice is not None:
+            return invoice
 
         raise ValueError(f"Invoice {invoice_id} not found")
 
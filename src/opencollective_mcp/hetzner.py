@@ -8,13 +8,84 @@ Requires HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD environment variable
 
 from __future__ import annotations
 
+import asyncio
 import io
+import os
 import re
+import threading
+import time
+from collections.abc import Generator
+from contextlib import closing
 from typing import Any, Optional
 
 import PyPDF2
 
-from .hetzner_browser import HetznerBrowserClient
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # Fall back to the pure-Python PyPDF2 extractor
+    pdfium = None
+
+from .hetzner_browser import (
+    HetznerBrowserClient,
+    HetznerInvoice,
+    get_shared_browser_client,
+)
+
+# PDFium is not thread-safe, even across separate documents, and parsing runs
+# in worker threads; only one thread may be inside PDFium at a time
+_PDFIUM_LOCK = threading.Lock()
+
+# How long scraped invoices are reused before hitting the browser (seconds)
+INVOICE_INDEX_TTL = 60.0
+
+# Invoice fields extracted from the PDF text; each pattern names its value group
+_FIELD_PATTERNS: dict[str, re.Pattern[str]] = {
+    "invoice_number": re.compile(
+        r"Invoice\s*No[:\.]?\s*(?P<invoice_number>\d+)", re.IGNORECASE
+    ),
+    "date": re.compile(r"Date[:\.]?\s*(?P<date>[A-Za-z]+\s+\d+,\s+\d{4})"),
+    "total": re.compile(r"Total[:\.]?\s*€?\s*(?P<total>[\d,]+\.\d{2})", re.IGNORECASE),
+    "net_amount": re.compile(
+        r"Net[:\.]?\s*€?\s*(?P<net_amount>[\d,]+\.\d{2})", re.IGNORECASE
+    ),
+    "vat_amount": re.compile(
+        r"VAT\s*\d+%\s*€?\s*(?P<vat_amount>[\d,]+\.\d{2})", re.IGNORECASE
+    ),
+    "customer_number": re.compile(
+        r"Customer\s*No[:\.]?\s*(?P<customer_number>[A-Z0-9]+)", re.IGNORECASE
+    ),
+    "contract": re.compile(r"Contract[:\.]?\s*(?P<contract>\d+)", re.IGNORECASE),
+}
+
+# All field patterns fused into one alternation so a single scan finds them all
+_FIELD_RE = re.compile(
+    "|".join(
+        f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})"
+        for p in _FIELD_PATTERNS.values()
+    )
+)
+
+
+def _iter_page_texts(pdf_bytes: bytes) -> Generator[str, None, None]:
+    """Yield the text of each page in order, extracting pages lazily.
+
+    Uses PDFium (native, much faster on multi-page invoices) when
+    pypdfium2 is installed, otherwise PyPDF2. With PDFium the lock is held
+    until the generator is exhausted or closed.
+    """
+    if pdfium is not None:
+        with _PDFIUM_LOCK:
+            doc = pdfium.PdfDocument(pdf_bytes)
+            try:
+                for page in doc:
+                    yield page.get_textpage().get_text_range()
+            finally:
+                doc.close()
+        return
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    for pdf_page in pdf_reader.pages:
+        yield pdf_page.extract_text()
 
 
 class HetznerClient:
@@ -29,6 +100,10 @@ class HetznerClient:
 
     Optional environment variables:
         HETZNER_HEADLESS: Set to 'false' to see the browser (default: 'true')
+        HETZNER_LOAD_ASSETS: Set to '1' to load images, fonts and CSS
+            (skipped by default)
+        HETZNER_RESET_PROFILE: Set to '1' to wipe the saved browser profile
+            before launching
     """
 
     def __init__(self, api_token: Optional[str] = None) -> None:
@@ -39,23 +114,25 @@ class HetznerClient:
         """
         self._api_token = api_token  # Kept for compatibility, not used
         self._browser_client: Optional[HetznerBrowserClient] = None
+        # invoice id -> (time listed, invoice), filled by list_invoices
+        self._invoice_index: dict[str, tuple[float, dict[str, Any]]] = {}
+        # (time listed, row limit, invoices) from the last list scrape
+        self._invoice_cache: Optional[tuple[float, int, list[dict[str, Any]]]] = None
 
     async def _get_browser_client(self) -> HetznerBrowserClient:
-        """Get or create the browser client."""
+        """Get the shared, logged-in browser client."""
         if self._browser_client is None:
-            import os
-
             headless = os.environ.get("HETZNER_HEADLESS", "true").lower() != "false"
-            self._browser_client = HetznerBrowserClient(headless=headless)
-            await self._browser_client.start()
-            await self._browser_client.login()
+            self._browser_client = await get_shared_browser_client(headless=headless)
         return self._browser_client
 
     async def close(self) -> None:
-        """Close the browser client."""
-        if self._browser_client:
-            await self._browser_client.close()
-            self._browser_client = None
+        """Release the browser client.
+
+        The browser is shared process-wide and closed at shutdown by
+        close_shared_browser_client().
+        """
+        self._browser_client = None
 
     async def list_invoices(
         self,
@@ -71,21 +148,7 @@ class HetznerClient:
         Returns:
             Dict with 'invoices' list and 'pagination' info
         """
-        client = await self._get_browser_client()
-        invoices = await client.list_invoices(limit=per_page)
-
-        # Convert to expected format
-        invoice_data = []
-        for inv in invoices:
-            invoice_data.append(
-                {
-                    "id": inv.invoice_id,
-                    "date": inv.date,
-                    "amount": inv.amount,
-                    "currency": inv.currency,
-                    "status": inv.status,
-                }
-            )
+        invoice_data = await self._fetch_invoices(per_page)
 
         return {
             "invoices": invoice_data,
@@ -96,6 +159,35 @@ class HetznerClient:
             },
         }
 
+    async def _fetch_invoices(self, limit: int) -> list[dict[str, Any]]:
+        """Scrape up to `limit` invoices, reusing a recent scrape if it covers it.
+
+        Each scrape drives a full browser session, so back-to-back tool calls
+        within INVOICE_INDEX_TTL share one result.
+        """
+        now = time.monotonic()
+        cache = self._invoice_cache
+        if cache and now - cache[0] < INVOICE_INDEX_TTL and cache[1] >= limit:
+            return cache[2][:limit]
+
+        client = await self._get_browser_client()
+        invoices = await client.list_invoices(limit=limit)
+
+        # Convert to expected format
+        invoice_data = [self._invoice_to_dict(inv) for inv in invoices]
+
+        now = time.monotonic()
+        self._invoice_cache = (now, limit, invoice_data)
+        self._invoice_index.update((inv["id"], (now, inv)) for inv in invoice_data)
+        return invoice_data
+
+    def _get_indexed_invoice(self, invoice_id: str) -> Optional[dict[str, Any]]:
+        """Return a recently listed invoice, or None if absent or expired."""
+        cached = self._invoice_index.get(invoice_id)
+        if cached and time.monotonic() - cached[0] < INVOICE_INDEX_TTL:
+            return cached[1]
+        return None
+
     async def get_invoice(self, invoice_id: str) -> dict[str, Any]:
         """Get a single invoice by ID.
 
@@ -105,20 +197,30 @@ class HetznerClient:
         Returns:
             Dict with invoice details
         """
+        # Browser round-trips are slow, so serve recently listed invoices
+        invoice = self._get_indexed_invoice(invoice_id)
+        if invoice is not None:
+            return invoice
+
         client = await self._get_browser_client()
-        invoices = await client.list_invoices(limit=100)
+        found = await client.get_invoice_by_id(invoice_id)
+        if found is None:
+            raise ValueError(f"Invoice {invoice_id} not found")
 
-        for inv in invoices:
-            if inv.invoice_id == invoice_id:
-                return {
-                    "id": inv.invoice_id,
-                    "date": inv.date,
-                    "amount": inv.amount,
-                    "currency": inv.currency,
-                    "status": inv.status,
-                }
+        invoice = self._invoice_to_dict(found)
+        self._invoice_index[invoice_id] = (time.monotonic(), invoice)
+        return invoice
 
-        raise ValueError(f"Invoice {invoice_id} not found")
+    @staticmethod
+    def _invoice_to_dict(inv: HetznerInvoice) -> dict[str, Any]:
+        """Convert a scraped invoice to the tool response format."""
+        return {
+            "id": inv.invoice_id,
+            "date": inv.date,
+            "amount": inv.amount,
+            "currency": inv.currency,
+            "status": inv.status,
+        }
 
     async def get_invoice_pdf(self, invoice_id: str) -> bytes:
         """Download an invoice as PDF bytes.
@@ -130,79 +232,88 @@ class HetznerClient:
             PDF file contents as bytes
         """
         client = await self._get_browser_client()
-        pdf_path = await client.download_invoice_pdf(invoice_id)
+        # Straight into memory; no temporary file to write and read back
+        return await client.fetch_invoice_pdf(invoice_id)
 
-        with open(pdf_path, "rb") as f:
-            return f.read()
-
-    async def get_invoice_pdf_parsed(self, invoice_id: str) -> dict[str, Any]:
+    async def get_invoice_pdf_parsed(
+        self, invoice_id: str, include_raw_text: bool = False
+    ) -> dict[str, Any]:
         """Download and parse an invoice PDF.
 
         Args:
             invoice_id: The invoice ID
+            include_raw_text: Also return the full extracted text as 'raw_text'
 
         Returns:
             Dict with parsed invoice data
         """
-        pdf_bytes = await self.get_invoice_pdf(invoice_id)
-        return self._parse_pdf(pdf_bytes, invoice_id)
+        _, parsed = await self.get_invoice_pdf_bundle(invoice_id, include_raw_text)
+        return parsed
 
-    def _parse_pdf(self, pdf_bytes: bytes, invoice_id: str) -> dict[str, Any]:
-        """Parse PDF content to extract invoice data.
+    async def get_invoice_pdf_bundle(
+        self, invoice_id: str, include_raw_text: bool = False
+    ) -> tuple[bytes, dict[str, Any]]:
+        """Download an invoice PDF once and parse it.
 
         Args:
-            pdf_bytes: PDF file contents
             invoice_id: The invoice ID
+            include_raw_text: Also return the full extracted text as 'raw_text'
 
         Returns:
-            Dict with parsed invoice data
+            Tuple of the PDF file contents and the parsed invoice data
         """
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+        pdf_bytes = await self.get_invoice_pdf(invoice_id)
+        # PDF text extraction is CPU-bound; keep it off the event loop
+        parsed = await asyncio.to_thread(
+            self._parse_pdf, pdf_bytes, invoice_id, include_raw_text
+        )
+        return pdf_bytes, parsed
+
+    def _parse_pdf(
+        self, pdf_bytes: bytes, invoice_id: str, include_raw_text: bool = False
+    ) -> dict[str, Any]:
+        """Parse PDF content to extract invoice data.
 
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+        Pages are scanned in order and extraction stops as soon as every
+        field has been found; the header fields normally all sit on page 1.
 
-        # Parse common invoice fields
-        data = {
-            "invoice_id": invoice_id,
-            "raw_text": text,
-        }
+        Args:
+            pdf_bytes: PDF file contents
+            invoice_id: The invoice ID
+            include_raw_text: Extract every page and return it as 'raw_text'
 
-        # Invoice number
-        match = re.search(r"Invoice\s*No[:\.]?\s*(\d+)", text, re.IGNORECASE)
-        if match:
-            data["invoice_number"] = match.group(1)
-
-        # Date
-        match = re.search(r"Date[:\.]?\s*([A-Za-z]+\s+\d+,\s+\d{4})", text)
-        if match:
-            data["date"] = match.group(1)
-
-        # Amount
-        match = re.search(r"Total[:\.]?\s*€?\s*([\d,]+\.\d{2})", text, re.IGNORECASE)
-        if match:
-            data["total"] = match.group(1)
-
-        # Net amount
-        match = re.search(r"Net[:\.]?\s*€?\s*([\d,]+\.\d{2})", text, re.IGNORECASE)
-        if match:
-            data["net_amount"] = match.group(1)
-
-        # VAT
-        match = re.search(r"VAT\s*\d+%\s*€?\s*([\d,]+\.\d{2})", text, re.IGNORECASE)
-        if match:
-            data["vat_amount"] = match.group(1)
-
-        # Customer number
-        match = re.search(r"Customer\s*No[:\.]?\s*([A-Z0-9]+)", text, re.IGNORECASE)
-        if match:
-            data["customer_number"] = match.group(1)
-
-        # Contract/account
-        match = re.search(r"Contract[:\.]?\s*(\d+)", text, re.IGNORECASE)
-        if match:
-            data["contract"] = match.group(1)
+        Returns:
+            Dict with parsed invoice data
+        """
+        data: dict[str, Any] = {"invoice_id": invoice_id}
+
+        found: dict[str, str] = {}
+        pages: list[str] = []
+        with closing(_iter_page_texts(pdf_bytes)) as page_texts:
+            for page_text in page_texts:
+                pages.append(page_text)
+                for match in _FIELD_RE.finditer(page_text):
+                    field = match.lastgroup
+                    if field and field not in found:
+                        found[field] = match.group(field)
+                if len(found) == len(_FIELD_PATTERNS) and not include_raw_text:
+                    break
+
+        text = "".join(page + "\n" for page in pages)
+        if include_raw_text:
+            data["raw_text"] = text
+
+        # The fused scan can miss a field whose first occurrence overlaps
+        # another field's match, so look those up individually
+        for field, pattern in _FIELD_PATTERNS.items():
+            if field not in found:
+                single = pattern.search(text)
+                if single:
+                    found[field] = single.group(field)
+
+        data.update(
+            (field, found[field]) for field in _FIELD_PATTERNS if field in found
+        )
 
         return data
 
@@ -212,16 +323,10 @@ class HetznerClient:
         Returns:
             Dict with the latest invoice details
         """
-        client = await self._get_browser_client()
-        invoice = await client.get_latest_invoice()
-
-        return {
-            "id": invoice.invoice_id,
-            "date": invoice.date,
-            "amount": invoice.amount,
-            "currency": invoice.currency,
-            "status": invoice.status,
-        }
+        invoices = await self._fetch_invoices(1)
+        if not invoices:
+            raise ValueError("No invoices found")
+        return invoices[0]
 
     async def get_latest_invoice_parsed(self) -> dict[str, Any]:
         """Get the most recent invoice with parsed PDF data.
@@ -229,20 +334,11 @@ class HetznerClient:
         Returns:
             Dict with parsed invoice data
         """
-        client = await self._get_browser_client()
-        invoice = await client.get_latest_invoice()
-
-        # Get parsed PDF
-        pdf_parsed = await self.get_invoice_pdf_parsed(invoice.invoice_id)
-
-        return {
-            "id": invoice.invoice_id,
-            "date": invoice.date,
-            "amount": invoice.amount,
-            "currency": invoice.currency,
-            "status": invoice.status,
-            "parsed": pdf_parsed,
-        }
+        # The PDF download needs the invoice ID, so it waits for the metadata,
+        # which comes from the invoice list cache when that is fresh
+        invoice = await self.get_latest_invoice()
+        pdf_parsed = await self.get_invoice_pdf_parsed(invoice["id"])
+        return {**invoice, "parsed": pdf_parsed}
 
     async def get_invoice_details(self, usage_id: str) -> dict[str, Any]:
         """Get detailed invoice data from usage.hetzner.com (CSV).
@@ -255,3 +351,18 @@ class HetznerClient:
         """
         client = await self._get_browser_client()
         return await client.get_invoice_details(usage_id)
+
+    async def get_invoice_details_batch(
+        self, usage_ids: list[str]
+    ) -> list[dict[str, Any] | BaseException]:
+        """Get detailed invoice data for several usage IDs concurrently.
+
+        Args:
+            usage_ids: The usage IDs from the invoices
+
+        Returns:
+            Parsed CSV data per usage ID, in order; a failed fetch is returned
+            as its exception
+        """
+        client = await self._get_browser_client()
+        return await client.get_invoices_details_batch(usage_ids)
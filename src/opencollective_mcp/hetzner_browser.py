@@ -9,15 +9,98 @@ if HETZNER_TOTP_SECRET is provided.
 
 from __future__ import annotations
 
+import asyncio
+import csv
+import io
 import os
+import re
+import shutil
+import tempfile
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
+import httpx
+import orjson
 import pyotp
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Page,
+    Route,
+)
 from playwright_stealth import Stealth  # type: ignore[import-untyped]
 
+# Saved cookies and localStorage, so restarts can skip the login flow
+STORAGE_STATE_PATH = (
+    Path.home() / ".cache" / "opencollective-mcp" / "hetzner-state.json"
+)
+# Saved sessions older than this are discarded and a fresh login is done
+STORAGE_STATE_MAX_AGE = 6 * 60 * 60
+
+# Chromium profile kept between runs so the Cloudflare clearance cookie and
+# HTTP caches survive restarts; HETZNER_RESET_PROFILE=1 wipes it
+PROFILE_DIR = Path.home() / ".cache" / "opencollective-mcp" / "hetzner-profile"
+# How Chromium reports a profile another process already has open
+_PROFILE_IN_USE = re.compile(
+    r"ProcessSingleton|SingletonLock|profile appears to be in use", re.IGNORECASE
+)
+
+# Reads every matching invoice row in one page.evaluate call instead of
+# several CDP round-trips per row
+_INVOICE_ROWS_JS = """
+({selector, limit}) => Array.from(document.querySelectorAll(selector))
+    .slice(0, limit)
+    .map(li => ({
+        id: li.id,
+        date: li.querySelector('.invoice-date')?.innerText ?? '',
+        amount: li.querySelector('.invoice-value')?.innerText ?? '',
+        status: li.querySelector('.invoice-status')?.innerText ?? '',
+        href: li.querySelector('a.btn-detail[href*="usage.hetzner.com"]')
+            ?.getAttribute('href') ?? '',
+        pdf_href: li.querySelector('a[href*="/pdf"]')?.href ?? '',
+    }))
+"""
+
+# Currency symbols in invoice amounts; amounts without one are in EUR
+_CURRENCY_SYMBOLS = {"€": "EUR", "$": "USD"}
+_CURRENCY_RE = re.compile("[€$]")
+
+# Resource types that scraping never needs; aborted unless HETZNER_LOAD_ASSETS=1
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+# How many listed invoices' PDF links are remembered for direct downloads
+PDF_HREF_CACHE_SIZE = 256
+
+# Usage CSVs of issued invoices never change, so they are kept in memory
+# and on disk keyed by customer number and usage ID
+CSV_CACHE_DIR = Path.home() / ".cache" / "opencollective-mcp" / "usage-csv"
+CSV_CACHE_SIZE = 256
+# Ids safe to put in cache file names and CSS attribute selectors
+_SAFE_NAME = re.compile(r"[A-Za-z0-9_-]+")
+
+# How long the session Cookie header is reused before re-reading cookies
+COOKIE_HEADER_TTL = 60.0
+
+# Process-wide HTTP client for usage.hetzner.com CSV downloads
+_HTTP: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for CSV downloads."""
+    global _HTTP
+    if _HTTP is None:
+        _HTTP = httpx.AsyncClient(
+            timeout=30.0,
+            # Kept open between tool calls, as for the Open Collective client
+            limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=120.0),
+            http2=True,
+        )
+    return _HTTP
+
 
 @dataclass
 class HetznerInvoice:
@@ -30,6 +113,7 @@ class HetznerInvoice:
     status: str
     pdf_path: Optional[Path] = None
     usage_id: Optional[str] = None
+    pdf_href: Optional[str] = None
 
 
 class HetznerBrowserClient:
@@ -55,6 +139,9 @@ class HetznerBrowserClient:
         totp_secret: Optional[str] = None,
         customer_number: Optional[str] = None,
         headless: bool = True,
+        storage_state_path: Optional[Path] = STORAGE_STATE_PATH,
+        csv_cache_dir: Optional[Path] = CSV_CACHE_DIR,
+        user_data_dir: Optional[Path] = PROFILE_DIR,
     ) -> None:
         self.email = email or os.environ.get("HETZNER_ACCOUNT_EMAIL")
         self.password = password or os.environ.get("HETZNER_ACCOUNT_PASSWORD")
@@ -63,11 +150,30 @@ class HetznerBrowserClient:
             "HETZNER_CUSTOMER_NUMBER"
         )
         self.headless = headless
+        # Set HETZNER_LOAD_ASSETS=1 if a page misbehaves without its CSS
+        load_assets = os.environ.get("HETZNER_LOAD_ASSETS", "").lower()
+        self.load_assets = load_assets in ("1", "true")
+        self.storage_state_path = storage_state_path
+        self.csv_cache_dir = csv_cache_dir
+        self.user_data_dir = user_data_dir
+        self.session_restored = False
         self._totp: Optional[pyotp.TOTP] = None
         if self.totp_secret:
             self._totp = pyotp.TOTP(self.totp_secret)
+        # (code, time step it is valid for)
+        self._totp_cache: tuple[str, int] = ("", -1)
         self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        # Serialises navigation on the shared page between concurrent callers
+        self._page_lock = asyncio.Lock()
+        # invoice id -> absolute PDF URL, oldest first, filled from listings
+        self._pdf_hrefs: dict[str, str] = {}
+        # (customer number, usage id) -> CSV content, oldest first
+        self._csv_cache: dict[tuple[str, str], str] = {}
+        # Cookie header built from the browser session, and when it was built
+        self._cookie_header: Optional[str] = None
+        self._cookie_ts = 0.0
         self._playwright = None
 
     async def __aenter__(self) -> "HetznerBrowserClient":
@@ -89,31 +195,100 @@ class HetznerBrowserClient:
         self._playwright_cm = self._stealth.use_async(async_playwright())
         self._playwright = await self._playwright_cm.__aenter__()
 
-        # Launch browser with additional args to avoid detection
+        # Launch browser with additional args to avoid detection. Web security
+        # and site isolation stay on; Playwright already runs Chromium without
+        # its sandbox by default (chromium_sandbox=False).
         assert self._playwright is not None
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-web-security",
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-            ],
-        )
+        launch_args = [
+            "--disable-blink-features=AutomationControlled",
+            "--disable-dev-shm-usage",
+        ]
+
+        # Realistic context settings
+        context_options: dict[str, Any] = {
+            "viewport": {"width": 1920, "height": 1080},
+            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "locale": "en-US",
+            "timezone_id": "America/New_York",
+        }
 
-        # Create context with realistic settings
-        context = await self._browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
+        # Reuse a saved session if its cookies are still valid
+        storage_state = self._load_storage_state()
 
-        self._page = await context.new_page()
+        context: Optional[BrowserContext] = None
+        profile_is_new = True
+        if self.user_data_dir:
+            profile_is_new = not (self.user_data_dir / "Default").exists()
+            context = await self._launch_persistent_context(
+                launch_args, context_options
+            )
+        if context is not None:
+            # A fresh profile starts from the saved session, if any; an
+            # existing one already holds its own newer cookies
+            if profile_is_new and storage_state:
+                state = orjson.loads(Path(storage_state).read_bytes())
+                await context.add_cookies(state["cookies"])
+            self.session_restored = not profile_is_new or storage_state is not None
+        else:
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=launch_args,
+            )
+            context = await self._browser.new_context(
+                **context_options,
+                storage_state=storage_state,
+            )
+            self.session_restored = storage_state is not None
+        self._context = context
+
+        # Skip images, fonts and CSS so navigations finish sooner
+        if not self.load_assets:
+            await context.route("**/*", self._block_assets)
+
+        # Persistent contexts open with a blank page already
+        self._page = context.pages[0] if context.pages else await context.new_page()
+
+    async def _launch_persistent_context(
+        self, launch_args: list[str], context_options: dict[str, Any]
+    ) -> Optional[BrowserContext]:
+        """Launch Chromium on the persistent profile.
+
+        Returns None if another process already has the profile open, so
+        the caller can fall back to a throwaway browser. Any other launch
+        failure is raised.
+        """
+        assert self._playwright is not None and self.user_data_dir is not None
+        try:
+            if os.environ.get("HETZNER_RESET_PROFILE", "").lower() in ("1", "true"):
+                shutil.rmtree(self.user_data_dir, ignore_errors=True)
+            self.user_data_dir.mkdir(parents=True, exist_ok=True)
+            # The profile holds live session cookies
+            os.chmod(self.user_data_dir, 0o700)
+            return await self._playwright.chromium.launch_persistent_context(
+                str(self.user_data_dir),
+                headless=self.headless,
+                args=launch_args,
+                **context_options,
+            )
+        except PlaywrightError as e:
+            if _PROFILE_IN_USE.search(str(e)):
+                return None
+            raise
+
+    @staticmethod
+    async def _block_assets(route: Route) -> None:
+        """Abort requests for resources the scraper does not read."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def close(self) -> None:
         """Close the browser."""
+        if self._context:
+            await self._context.close()
+            self._context = None
+            self._page = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -123,11 +298,43 @@ class HetznerBrowserClient:
             self._playwright_cm = None
             self._playwright = None
 
+    def _load_storage_state(self) -> Optional[str]:
+        """Return the saved state file path if it is recent and unexpired."""
+        path = self.storage_state_path
+        if not path or not path.is_file():
+            return None
+        try:
+            if time.time() - path.stat().st_mtime > STORAGE_STATE_MAX_AGE:
+                return None
+            cookies = orjson.loads(path.read_bytes()).get("cookies") or []
+        except (OSError, orjson.JSONDecodeError, AttributeError):
+            return None
+
+        # Session cookies are saved with expires == -1
+        now = time.time()
+        if not cookies or any(0 < c.get("expires", -1) < now for c in cookies):
+            return None
+        return str(path)
+
+    async def _save_storage_state(self) -> None:
+        """Save cookies and localStorage for reuse by later runs."""
+        path = self.storage_state_path
+        if not path or not self._page:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await self._page.context.storage_state(path=path)
+        # The file holds live session cookies
+        os.chmod(path, 0o600)
+
     def _get_totp_code(self) -> str:
         """Generate a TOTP code from the secret."""
         if not self._totp:
             raise RuntimeError("No TOTP secret configured")
-        return self._totp.now()
+        # Codes only change once per interval, so reuse the current one
+        step = int(time.time()) // self._totp.interval
+        if self._totp_cache[1] != step:
+            self._totp_cache = (self._totp.at(step * self._totp.interval), step)
+        return self._totp_cache[0]
 
     async def login(self) -> None:
         """Log into Hetzner Accounts, handling 2FA if configured."""
@@ -146,9 +353,6 @@ class HetznerBrowserClient:
             self.LOGIN_URL, wait_until="domcontentloaded", timeout=30000
         )
 
-        # Wait for page to stabilize
-        await self._page.wait_for_timeout(2000)
-
         # Wait for login form and fill credentials
         # Note: Hetzner uses _username, not email
         await self._page.wait_for_selector('input[name="_username"]', timeout=15000)
@@ -158,27 +362,38 @@ class HetznerBrowserClient:
         # Submit login form
         await self._page.click('input[type="submit"]')
 
-        # Wait for navigation - handle both direct login and 2FA
+        # Continue as soon as the 2FA form, the dashboard or an error shows up
         try:
-            # Wait for either dashboard or 2FA page
-            await self._page.wait_for_load_state("networkidle", timeout=10000)
+            landed = await self._page.wait_for_selector(
+                'input[name="_auth_code"], a[href*="/logout"], .login-error',
+                timeout=15000,
+            )
         except Exception:
-            pass  # Continue to check URL
-
-        # Check if we're on a 2FA/TOTP page
-        current_url = self._page.url
-        page_content = await self._page.content()
-
-        is_2fa_page = (
-            "totp" in current_url.lower()
-            or "2fa" in current_url.lower()
-            or "two-factor" in page_content.lower()
-            or "2fa" in page_content.lower()
-            or "totp" in page_content.lower()
-            or 'input[name="totp"]' in page_content
-            or 'input[name="code"]' in page_content
-            or 'input[name="_auth_code"]' in page_content
-        )
+            landed = None  # Fall back to inspecting the URL and content
+
+        if landed is not None:
+            if await landed.get_attribute("name") == "_auth_code":
+                is_2fa_page = True
+            elif "login-error" in (await landed.get_attribute("class") or ""):
+                error = (await landed.inner_text()).strip()
+                raise RuntimeError(f"Login failed - {error or 'rejected by Hetzner'}")
+            else:
+                is_2fa_page = False
+        else:
+            # Check if we're on a 2FA/TOTP page
+            current_url = self._page.url
+            page_content = await self._page.content()
+
+            is_2fa_page = (
+                "totp" in current_url.lower()
+                or "2fa" in current_url.lower()
+                or "two-factor" in page_content.lower()
+                or "2fa" in page_content.lower()
+                or "totp" in page_content.lower()
+                or 'input[name="totp"]' in page_content
+                or 'input[name="code"]' in page_content
+                or 'input[name="_auth_code"]' in page_content
+            )
 
         if is_2fa_page:
             if not self._totp:
@@ -217,6 +432,23 @@ class HetznerBrowserClient:
                 # Might already be logged in or on unexpected page
                 pass
 
+        # The session cookies changed, so rebuild the header on next use
+        self._cookie_header = None
+        await self._save_storage_state()
+
+    async def ensure_logged_in(self) -> None:
+        """Log in unless the restored session is still accepted by Hetzner."""
+        if not self._page:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        if self.session_restored:
+            await self._page.goto(self.INVOICES_URL, wait_until="domcontentloaded")
+            # Expired sessions are redirected to the login page
+            if "/login" not in self._page.url:
+                return
+
+        await self.login()
+
     async def list_invoices(self, limit: int = 20) -> list[HetznerInvoice]:
         """List invoices from the Hetzner Accounts interface.
 
@@ -226,60 +458,146 @@ class HetznerBrowserClient:
         if not self._page:
             raise RuntimeError("Browser not started. Call start() first.")
 
-        await self._page.goto(self.INVOICES_URL)
+        async with self._page_lock:
+            await self._page.goto(self.INVOICES_URL, wait_until="domcontentloaded")
 
-        # Wait for invoice list to load (ul.invoice-list)
-        await self._page.wait_for_selector("ul.invoice-list", timeout=10000)
+            # Wait for invoice list to load (ul.invoice-list)
+            await self._page.wait_for_selector("ul.invoice-list", timeout=10000)
 
-        # Extract invoice data from the list
-        invoices = []
-        items = await self._page.query_selector_all("ul.invoice-list li")
+            # Extract invoice data from the list
+            return await self._read_invoice_rows("ul.invoice-list li", limit)
 
-        for item in items[:limit]:
-            invoice_id = await item.get_attribute("id")
-            if not invoice_id:
-                continue
+    async def get_invoice_by_id(self, invoice_id: str) -> Optional[HetznerInvoice]:
+        """Get a single invoice by ID.
+
+        Reads only the matching row instead of scraping the whole list.
 
-            date_elem = await item.query_selector(".invoice-date")
-            amount_elem = await item.query_selector(".invoice-value")
-            status_elem = await item.query_selector(".invoice-status")
+        Returns:
+            HetznerInvoice, or None if the invoice is not listed.
+        """
+        if not self._page:
+            raise RuntimeError("Browser not started. Call start() first.")
+        row_selector = _invoice_row_selector(invoice_id)
+        if row_selector is None:
+            return None
 
-            date = (await date_elem.inner_text()) if date_elem else ""
-            amount_text = (await amount_elem.inner_text()) if amount_elem else ""
-            status = (await status_elem.inner_text()) if status_elem else ""
+        async with self._page_lock:
+            await self._page.goto(self.INVOICES_URL, wait_until="domcontentloaded")
+            await self._page.wait_for_selector("ul.invoice-list", timeout=10000)
 
-            # Extract usage ID from details link
-            usage_id = None
-            details_link = await item.query_selector(
-                'a.btn-detail[href*="usage.hetzner.com"]'
-            )
-            if details_link:
-                href = await details_link.get_attribute("href")
-                if href:
-                    # Extract ID from URL like https://usage.hetzner.com/7b65bc9a-6229-4019-99f8-31ef3e0ec8c6
-                    usage_id = href.rstrip("/").split("/")[-1]
-
-            # Parse amount and currency
-            amount = amount_text.strip()
-            currency = "EUR"
-            if "€" in amount:
-                currency = "EUR"
-            elif "$" in amount:
-                currency = "USD"
-
-            invoices.append(
-                HetznerInvoice(
-                    invoice_id=invoice_id,
-                    date=date.strip(),
-                    amount=amount,
-                    currency=currency,
-                    status=status.strip(),
-                    usage_id=usage_id,
-                )
+            invoices = await self._read_invoice_rows(
+                f"ul.invoice-list {row_selector}", 1
             )
+            return invoices[0] if invoices else None
 
+    async def _read_invoice_rows(
+        self, selector: str, limit: int
+    ) -> list[HetznerInvoice]:
+        """Extract invoices from the invoice list rows matching selector."""
+        assert self._page is not None
+        rows = await self._page.evaluate(
+            _INVOICE_ROWS_JS, {"selector": selector, "limit": limit}
+        )
+        invoices = []
+        for row in rows:
+            invoice = self._parse_invoice_row(row)
+            if invoice:
+                invoices.append(invoice)
+                if invoice.pdf_href:
+                    _bounded_put(
+                        self._pdf_hrefs,
+                        invoice.invoice_id,
+                        invoice.pdf_href,
+                        PDF_HREF_CACHE_SIZE,
+                    )
         return invoices
 
+    @staticmethod
+    def _parse_invoice_row(row: dict[str, str]) -> Optional[HetznerInvoice]:
+        """Build an invoice from the raw text of an invoice list row."""
+        invoice_id = row["id"]
+        if not invoice_id:
+            return None
+
+        # Extract usage ID from details link
+        usage_id = None
+        href = row["href"]
+        if href:
+            # Extract ID from URL like https://usage.hetzner.com/7b65bc9a-6229-4019-99f8-31ef3e0ec8c6
+            usage_id = href.rstrip("/").split("/")[-1]
+
+        # Parse amount and currency
+        amount = row["amount"].strip()
+        symbol = _CURRENCY_RE.search(amount)
+        currency = _CURRENCY_SYMBOLS[symbol.group()] if symbol else "EUR"
+
+        return HetznerInvoice(
+            invoice_id=invoice_id,
+            date=row["date"].strip(),
+            amount=amount,
+            currency=currency,
+            status=row["status"].strip(),
+            usage_id=usage_id,
+            pdf_href=row["pdf_href"] or None,
+        )
+
+    async def fetch_invoice_pdf(self, invoice_id: str) -> bytes:
+        """Fetch a specific invoice PDF into memory.
+
+        The PDF is requested through the browser context, which shares the
+        session cookies, instead of going through Chromium's download manager.
+
+        Args:
+            invoice_id: The invoice ID to fetch
+
+        Returns:
+            PDF file contents as bytes
+        """
+        if not self._page:
+            raise RuntimeError("Browser not started. Call start() first.")
+        row_selector = _invoice_row_selector(invoice_id)
+        if row_selector is None:
+            raise ValueError(f"Invoice {invoice_id} not found or no PDF available")
+
+        # A recently listed PDF is fetched without navigating the shared page
+        pdf_href = self._pdf_hrefs.get(invoice_id)
+        if pdf_href:
+            pdf_bytes = await self._request_pdf(pdf_href)
+            if pdf_bytes is not None:
+                return pdf_bytes
+            # Link expired or session lost; look it up on the page again
+            self._pdf_hrefs.pop(invoice_id, None)
+
+        async with self._page_lock:
+            # Navigate to invoices page
+            await self._page.goto(self.INVOICES_URL, wait_until="domcontentloaded")
+            await self._page.wait_for_selector("ul.invoice-list", timeout=10000)
+
+            # The PDF link is inside the li element with the invoice ID
+            pdf_link = await self._page.query_selector(
+                f'{row_selector} a[href*="/pdf"]'
+            )
+
+            if not pdf_link:
+                raise ValueError(f"Invoice {invoice_id} not found or no PDF available")
+
+            pdf_href = await pdf_link.evaluate("a => a.href")
+
+        pdf_bytes = await self._request_pdf(pdf_href)
+        if pdf_bytes is None:
+            raise RuntimeError(f"Failed to download PDF for invoice {invoice_id}")
+        _bounded_put(self._pdf_hrefs, invoice_id, pdf_href, PDF_HREF_CACHE_SIZE)
+        return pdf_bytes
+
+    async def _request_pdf(self, url: str) -> Optional[bytes]:
+        """GET a PDF with the session cookies; None if a PDF wasn't returned."""
+        assert self._page is not None
+        response = await self._page.context.request.get(url)
+        body = await response.body()
+        if response.ok and body.startswith(b"%PDF"):
+            return body
+        return None
+
     async def download_invoice_pdf(
         self,
         invoice_id: str,
@@ -294,33 +612,12 @@ class HetznerBrowserClient:
         Returns:
             Path to the downloaded PDF file
         """
-        if not self._page:
-            raise RuntimeError("Browser not started. Call start() first.")
+        pdf_bytes = await self.fetch_invoice_pdf(invoice_id)
 
         download_dir = download_dir or Path("/tmp")
         download_dir.mkdir(parents=True, exist_ok=True)
-
-        # Navigate to invoices page
-        await self._page.goto(self.INVOICES_URL)
-        await self._page.wait_for_selector("ul.invoice-list", timeout=10000)
-
-        # Find the invoice row and click the PDF link
-        # The PDF link is inside the li element with the invoice ID
-        pdf_link = await self._page.query_selector(
-            f'li[id="{invoice_id}"] a[href*="/pdf"]'
-        )
-
-        if not pdf_link:
-            raise ValueError(f"Invoice {invoice_id} not found or no PDF available")
-
-        # Set up download handler
         pdf_path = download_dir / f"hetzner_invoice_{invoice_id}.pdf"
-
-        async with self._page.expect_download() as download_info:
-            await pdf_link.click()
-
-        download = await download_info.value
-        await download.save_as(pdf_path)
+        await asyncio.to_thread(pdf_path.write_bytes, pdf_bytes)
 
         return pdf_path
 
@@ -345,13 +642,46 @@ class HetznerBrowserClient:
             Dict with parsed CSV invoice data
         """
         csv_content = await self.get_invoice_csv(usage_id)
+        return self._parse_usage_csv(usage_id, csv_content)
 
-        # Parse CSV
-        import csv
-        import io
+    async def get_invoices_details_batch(
+        self,
+        usage_ids: list[str],
+        max_concurrency: int = 8,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Get detailed invoice information for several usage IDs concurrently.
 
-        reader = csv.DictReader(io.StringIO(csv_content))
-        rows = list(reader)
+        Returns:
+            Parsed CSV data per usage ID, in the same order. A failed fetch is
+            returned as its exception so it does not abort the batch.
+        """
+        csvs = await self.get_invoices_csv_batch(usage_ids, max_concurrency)
+        return [
+            csv_content
+            if isinstance(csv_content, BaseException)
+            else self._parse_usage_csv(usage_id, csv_content)
+            for usage_id, csv_content in zip(usage_ids, csvs)
+        ]
+
+    def _parse_usage_csv(self, usage_id: str, csv_content: str) -> dict[str, Any]:
+        """Turn a usage CSV into the get_invoice_details result."""
+        # Parse CSV. Zipping each row onto the header takes about half the
+        # time of csv.DictReader, which does its per-row work in Python.
+        reader = csv.reader(io.StringIO(csv_content))
+        header = next(reader, [])
+        width = len(header)
+        rows: list[dict[Any, Any]] = []
+        for values in reader:
+            if not values:
+                continue
+            row: dict[Any, Any] = dict(zip(header, values))
+            if len(values) != width:
+                # Ragged rows keep DictReader's None padding / None overflow key
+                for key in header[len(values) :]:
+                    row[key] = None
+                if len(values) > width:
+                    row[None] = values[width:]
+            rows.append(row)
 
         return {
             "usage_id": usage_id,
@@ -361,11 +691,18 @@ class HetznerBrowserClient:
             "csv_raw": csv_content,
         }
 
-    async def get_invoice_csv(self, usage_id: str) -> str:
+    async def get_invoice_csv(
+        self,
+        usage_id: str,
+        client: Optional[httpx.AsyncClient] = None,
+        cookie_header: Optional[str] = None,
+    ) -> str:
         """Get invoice data as CSV.
 
         Args:
             usage_id: The usage ID from the invoice
+            client: Optional HTTP client (defaults to the shared one)
+            cookie_header: Optional prebuilt session Cookie header
 
         Returns:
             CSV content as string
@@ -375,16 +712,184 @@ class HetznerBrowserClient:
                 "Customer number required. Set HETZNER_CUSTOMER_NUMBER env var."
             )
 
-        # Fetch CSV directly via HTTP
-        import httpx
+        key = (self.customer_number, usage_id)
+        csv_content = self._csv_cache.get(key)
+        if csv_content is None:
+            csv_content = await asyncio.to_thread(self._read_cached_csv, key)
+        if csv_content is not None:
+            _bounded_put(self._csv_cache, key, csv_content, CSV_CACHE_SIZE)
+            return csv_content
 
         csv_url = f"https://usage.hetzner.com/{usage_id}?csv&cn={self.customer_number}"
 
         # Need to include session cookies from browser
-        assert self._page is not None
-        cookies = await self._page.context.cookies()
-        cookie_header = "; ".join([f"{c['name']}={c['value']}" for c in cookies])
+        if cookie_header is None:
+            cookie_header = await self._get_cookie_header()
+
+        # Fetch CSV directly via HTTP
+        client = client or _get_http_client()
+        response = await client.get(csv_url, headers={"Cookie": cookie_header})
+        if response.status_code == 401:
+            # The header may predate a cookie refresh; rebuild it and retry once
+            self._cookie_header = None
+            cookie_header = await self._get_cookie_header()
+            response = await client.get(csv_url, headers={"Cookie": cookie_header})
+        response.raise_for_status()
+
+        csv_content = response.text
+        if not _looks_like_csv(csv_content):
+            # Typically the login page, served with 200 once the session has
+            # expired; rebuild the cookies next time and cache nothing
+            self._cookie_header = None
+            raise ValueError(
+                f"Expected a CSV for usage ID {usage_id}; the Hetzner session "
+                "may have expired. Try again."
+            )
+        _bounded_put(self._csv_cache, key, csv_content, CSV_CACHE_SIZE)
+        await asyncio.to_thread(self._write_cached_csv, key, csv_content)
+        return csv_content
+
+    def _cached_csv_path(self, key: tuple[str, str]) -> Optional[Path]:
+        """Return the on-disk cache file for a CSV, if caching to disk."""
+        if not self.csv_cache_dir or not all(_SAFE_NAME.fullmatch(k) for k in key):
+            return None
+        return self.csv_cache_dir / f"{key[0]}_{key[1]}.csv"
+
+    def _read_cached_csv(self, key: tuple[str, str]) -> Optional[str]:
+        """Read a CSV saved by an earlier run, or None if there is none."""
+        path = self._cached_csv_path(key)
+        if not path:
+            return None
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write_cached_csv(self, key: tuple[str, str], csv_content: str) -> None:
+        """Save a CSV for later runs; failures only cost a refetch."""
+        path = self._cached_csv_path(key)
+        if not path:
+            return
+        try:
+            # Billing data, so keep it private like the session state: the
+            # temporary file is created 0o600 and renamed into place whole
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(csv_content)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+    async def get_invoices_csv_batch(
+        self,
+        usage_ids: list[str],
+        max_concurrency: int = 8,
+    ) -> list[str | BaseException]:
+        """Get CSV data for several invoices concurrently.
+
+        Args:
+            usage_ids: The usage IDs to fetch
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            CSV content per usage ID, in the same order. A failed fetch is
+            returned as its exception so it does not abort the batch.
+        """
+        if not self.customer_number:
+            raise ValueError(
+                "Customer number required. Set HETZNER_CUSTOMER_NUMBER env var."
+            )
+
+        # Build the cookie header once up front; every fetch reuses it and
+        # the shared HTTP client
+        cookie_header = await self._get_cookie_header()
+        client = _get_http_client()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(usage_id: str) -> str:
+            async with semaphore:
+                return await self.get_invoice_csv(
+                    usage_id, client=client, cookie_header=cookie_header
+                )
+
+        return await asyncio.gather(
+            *(fetch(usage_id) for usage_id in usage_ids),
+            return_exceptions=True,
+        )
 
-        response = httpx.get(csv_url, headers={"Cookie": cookie_header}, timeout=30)
+    async def _get_cookie_header(self) -> str:
+        """Get a Cookie header for the browser session, cached briefly."""
+        now = time.monotonic()
+        if self._cookie_header is None or now - self._cookie_ts >= COOKIE_HEADER_TTL:
+            assert self._page is not None
+            cookies = await self._page.context.cookies()
+            self._cookie_header = "; ".join(
+                [f"{c['name']}={c['value']}" for c in cookies]
+            )
+            self._cookie_ts = now
+        return self._cookie_header
 
-        return response.text
+
+def _invoice_row_selector(invoice_id: str) -> Optional[str]:
+    """CSS selector for an invoice's row, or None if the id can't be one.
+
+    The id is checked against _SAFE_NAME so it can't break out of the
+    attribute selector.
+    """
+    if not _SAFE_NAME.fullmatch(invoice_id):
+        return None
+    return f'li[id="{invoice_id}"]'
+
+
+def _looks_like_csv(content: str) -> bool:
+    """Check that a usage response starts with a CSV header row."""
+    header = content.lstrip("\ufeff").partition("\n")[0]
+    return not header.lstrip().startswith("<") and ("," in header or ";" in header)
+
+
+def _bounded_put(cache: dict[Any, Any], key: Any, value: Any, max_size: int) -> None:
+    """Insert into an insertion-ordered cache, evicting the oldest past max_size."""
+    cache.pop(key, None)
+    cache[key] = value
+    if len(cache) > max_size:
+        del cache[next(iter(cache))]
+
+
+# Process-wide browser so every HetznerClient shares one Chromium instance,
+# context and login session
+_SHARED_BROWSER: Optional[HetznerBrowserClient] = None
+_SHARED_BROWSER_LOCK = asyncio.Lock()
+
+
+async def get_shared_browser_client(headless: bool = True) -> HetznerBrowserClient:
+    """Get or start the process-wide logged-in browser client."""
+    global _SHARED_BROWSER
+    if _SHARED_BROWSER is None:
+        async with _SHARED_BROWSER_LOCK:
+            # Another caller may have finished starting it while we waited
+            if _SHARED_BROWSER is None:
+                client = HetznerBrowserClient(headless=headless)
+                await client.start()
+                try:
+                    await client.ensure_logged_in()
+                except Exception:
+                    await client.close()
+                    raise
+                _SHARED_BROWSER = client
+    return _SHARED_BROWSER
+
+
+async def close_shared_browser_client() -> None:
+    """Close the process-wide browser and CSV HTTP clients, if started."""
+    global _SHARED_BROWSER, _HTTP
+    if _SHARED_BROWSER is not None:
+        await _SHARED_BROWSER.close()
+        _SHARED_BROWSER = None
+    if _HTTP is not None:
+        await _HTTP.aclose()
+        _HTTP = None
@@ -4,6 +4,10 @@ Organized by domain: accounts, expenses, transactions, members.
 Each constant is a ready-to-use GraphQL operation string.
 """
 
+import functools
+import hashlib
+import re
+
 # ---------------------------------------------------------------------------
 # Accounts
 # ---------------------------------------------------------------------------
@@ -99,6 +103,7 @@ query GetMembers($slug: String!, $limit: Int!, $offset: Int!) {
 # Expenses
 # ---------------------------------------------------------------------------
 
+# Prepended to every operation that selects ...ExpenseFields
 EXPENSE_FRAGMENT = """
 fragment ExpenseFields on Expense {
   id
@@ -124,17 +129,20 @@ fragment ExpenseFields on Expense {
 }
 """
 
-GET_EXPENSE = f"""
-{EXPENSE_FRAGMENT}
-query GetExpense($id: String, $legacyId: Int) {{
-  expense(expense: {{ id: $id, legacyId: $legacyId }}) {{
+GET_EXPENSE = (
+    EXPENSE_FRAGMENT
+    + """
+query GetExpense($id: String, $legacyId: Int) {
+  expense(expense: { id: $id, legacyId: $legacyId }) {
     ...ExpenseFields
-  }}
-}}
+  }
+}
 """
+)
 
-LIST_EXPENSES = f"""
-{EXPENSE_FRAGMENT}
+LIST_EXPENSES = (
+    EXPENSE_FRAGMENT
+    + """
 query ListExpenses(
   $account: AccountReferenceInput
   $fromAccount: AccountReferenceInput
@@ -147,7 +155,7 @@ query ListExpenses(
   $dateTo: DateTime
   $searchTerm: String
   $orderBy: ChronologicalOrderInput
-) {{
+) {
   expenses(
     account: $account
     fromAccount: $fromAccount
@@ -160,35 +168,40 @@ query ListExpenses(
     dateTo: $dateTo
     searchTerm: $searchTerm
     orderBy: $orderBy
-  ) {{
+  ) {
     totalCount
-    nodes {{
+    nodes {
       ...ExpenseFields
-    }}
-  }}
-}}
+    }
+  }
+}
 """
+)
 
-CREATE_EXPENSE = f"""
-{EXPENSE_FRAGMENT}
+CREATE_EXPENSE = (
+    EXPENSE_FRAGMENT
+    + """
 mutation CreateExpense(
   $expense: ExpenseCreateInput!
   $account: AccountReferenceInput!
-) {{
-  createExpense(expense: $expense, account: $account) {{
+) {
+  createExpense(expense: $expense, account: $account) {
     ...ExpenseFields
-  }}
-}}
+  }
+}
 """
+)
 
-EDIT_EXPENSE = f"""
-{EXPENSE_FRAGMENT}
-mutation EditExpense($expense: ExpenseUpdateInput!) {{
-  editExpense(expense: $expense) {{
+EDIT_EXPENSE = (
+    EXPENSE_FRAGMENT
+    + """
+mutation EditExpense($expense: ExpenseUpdateInput!) {
+  editExpense(expense: $expense) {
     ...ExpenseFields
-  }}
-}}
+  }
+}
 """
+)
 
 DELETE_EXPENSE = """
 mutation DeleteExpense($id: String, $legacyId: Int) {
@@ -198,23 +211,25 @@ mutation DeleteExpense($id: String, $legacyId: Int) {
 }
 """
 
-PROCESS_EXPENSE = f"""
-{EXPENSE_FRAGMENT}
+PROCESS_EXPENSE = (
+    EXPENSE_FRAGMENT
+    + """
 mutation ProcessExpense(
   $id: String
   $legacyId: Int
   $action: ExpenseProcessAction!
   $message: String
-) {{
+) {
   processExpense(
-    expense: {{ id: $id, legacyId: $legacyId }}
+    expense: { id: $id, legacyId: $legacyId }
     action: $action
     message: $message
-  ) {{
+  ) {
     ...ExpenseFields
-  }}
-}}
+  }
+}
 """
+)
 
 # ---------------------------------------------------------------------------
 # Transactions / Ledger
@@ -291,3 +306,82 @@ mutation EditAccountSetting($account: AccountReferenceInput!, $key: String!, $va
   }
 }
 """
+
+# ---------------------------------------------------------------------------
+# Minification
+# ---------------------------------------------------------------------------
+
+# String literals (kept verbatim), comments, and whitespace runs with any
+# adjacent punctuation
+_TOKEN_RE = re.compile(r'("(?:[^"\\]|\\.)*")|#[^\n]*|\s*([{}():!=@\[\]])\s*|\s+')
+
+
+def _minify(query: str) -> str:
+    """Drop pretty-printing whitespace and comments from a GraphQL document.
+
+    GraphQL ignores whitespace between tokens, so only string literals need
+    to be preserved as written.
+    """
+    return _TOKEN_RE.sub(lambda m: m.group(1) or m.group(2) or " ", query).strip()
+
+
+# ---------------------------------------------------------------------------
+# Automatic Persisted Queries
+# ---------------------------------------------------------------------------
+
+# Minified query -> SHA-256 hex digest of each query used so far
+_HASH_BY_QUERY: dict[str, str] = {}
+
+# The constants above are taken out of the module namespace and minified and
+# hashed on first access (PEP 562 __getattr__), so importing this module does
+# no work for operations a session never sends
+_SOURCES: dict[str, str] = {
+    name: value
+    for name, value in list(globals().items())
+    if name.isupper() and isinstance(value, str)
+}
+for _name in _SOURCES:
+    del globals()[_name]
+
+
+def __getattr__(name: str) -> str:
+    try:
+        source = _SOURCES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Every operation is sent minified
+    query = _minify(source)
+    _HASH_BY_QUERY[query] = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    globals()[name] = query  # Later lookups no longer reach __getattr__
+    return query
+
+
+@functools.lru_cache(maxsize=32)
+def create_expenses_batch(count: int) -> str:
+    """Return one mutation document that creates count expenses.
+
+    The createExpense fields are aliased e0, e1, ... and take the variables
+    $e0_expense/$e0_account, $e1_expense/$e1_account, ...
+    """
+    definitions = "\n".join(
+        f"  $e{i}_expense: ExpenseCreateInput!\n  $e{i}_account: AccountReferenceInput!"
+        for i in range(count)
+    )
+    fields = "\n".join(
+        f"  e{i}: createExpense(expense: $e{i}_expense, account: $e{i}_account) {{\n"
+        "    ...ExpenseFields\n"
+        "  }"
+        for i in range(count)
+    )
+    return _minify(
+        _SOURCES["EXPENSE_FRAGMENT"]
+        + f"mutation CreateExpenses(\n{definitions}\n) {{\n{fields}\n}}\n"
+    )
+
+
+def persisted_query_hash(query: str) -> str:
+    """Return the APQ SHA-256 hash of a query, precomputed for known ones."""
+    sha256 = _HASH_BY_QUERY.get(query)
+    if sha256 is None:
+        sha256 = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    return sha256
@@ -11,20 +11,28 @@ Provides tools to interact with the OpenCollective GraphQL API v2 for:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import base64
+import functools
+import hashlib
 import os
+import random
+import time
 from contextlib import asynccontextmanager
-from typing import Any, Optional, cast
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Annotated, Any, Awaitable, Callable, Optional, cast
 
 import httpx
+import orjson
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
 
 from . import client as oc_client
 from . import cloudflare as cloudflare_client
 from . import hetzner as hetzner_client
-from . import queries
+from . import hetzner_browser, queries
 
 # ---------------------------------------------------------------------------
 # Lifespan: initialize the OpenCollective client once
@@ -40,13 +48,22 @@ async def app_lifespan(server: FastMCP):
     _hetzner_client = hetzner_client.HetznerClient()
     # Cloudflare client is also lazy - API calls on first use
     _cloudflare_client = None
-    yield {
-        "oc_client": _oc_client,
-        "hetzner_client": _hetzner_client,
-        "cloudflare_client": _cloudflare_client,
-    }
+    try:
+        yield {
+            "oc_client": _oc_client,
+            "hetzner_client": _hetzner_client,
+            "cloudflare_client": _cloudflare_client,
+        }
+    finally:
+        await _oc_client.close()
+        # Shared by every Cloudflare/Hetzner client, so closed once at shutdown
+        await cloudflare_client.close_shared_exchange_client()
+        await hetzner_browser.close_shared_browser_client()
 
 
+# Tools are registered with structured_output=False: they return ready-made
+# JSON text, which structured output would send a second time as
+# {"result": "..."} in every response
 mcp = FastMCP("opencollective_mcp", lifespan=app_lifespan)
 
 # ---------------------------------------------------------------------------
@@ -54,10 +71,7 @@ mcp = FastMCP("opencollective_mcp", lifespan=app_lifespan)
 # ---------------------------------------------------------------------------
 
 
-@mcp.prompt()
-def opencollective_overview() -> str:
-    """Overview of OpenCollective MCP tools."""
-    return """
+_OVERVIEW_PROMPT = """
 # OpenCollective MCP Tools Guide
 
 This MCP provides tools to manage OpenCollective collectives, Hetzner Cloud invoices, and Cloudflare billing.
@@ -67,8 +81,10 @@ This MCP provides tools to manage OpenCollective collectives, Hetzner Cloud invo
 ### OpenCollective Tools
 - `oc_get_account`: Get account details by slug (no auth needed for public data)
 - `oc_search_accounts`: Search collectives/organizations
+- `oc_bootstrap_context`: Account details, members and recent expenses in one call
 - `oc_list_expenses`: List expenses with filters (status, type, date, tags)
 - `oc_create_expense`: Submit new expense (requires auth)
+- `oc_create_expenses_batch`: Submit several expenses in one request
 - `oc_process_expense`: Approve/reject/pay expenses
 - `oc_edit_account_setting`: Edit account settings
 - `oc_set_budget`: Set yearly budget goal (requires token with 'account' scope)
@@ -128,9 +144,12 @@ This MCP provides tools to manage OpenCollective collectives, Hetzner Cloud invo
 
 
 @mcp.prompt()
-def expense_creation_guide() -> str:
-    """Guide for creating expenses correctly."""
-    return """
+def opencollective_overview() -> str:
+    """Overview of OpenCollective MCP tools."""
+    return _OVERVIEW_PROMPT
+
+
+_EXPENSE_GUIDE_PROMPT = """
 # Creating OpenCollective Expenses
 
 ## Required Parameters
@@ -171,9 +190,12 @@ Default is ACCOUNT_BALANCE (pays from collective balance). For external payees,
 
 
 @mcp.prompt()
-def budget_guide() -> str:
-    """Guide for setting budgets."""
-    return """
+def expense_creation_guide() -> str:
+    """Guide for creating expenses correctly."""
+    return _EXPENSE_GUIDE_PROMPT
+
+
+_BUDGET_GUIDE_PROMPT = """
 # Setting Budget Goals
 
 ## oc_set_budget Tool
@@ -203,6 +225,12 @@ Note: amount is in cents (80000 = €800)
 """
 
 
+@mcp.prompt()
+def budget_guide() -> str:
+    """Guide for setting budgets."""
+    return _BUDGET_GUIDE_PROMPT
+
+
 # Module-level clients (initialized by lifespan)
 _oc_client: Optional[oc_client.OpenCollectiveClient] = None
 _hetzner_client: Optional[hetzner_client.HetznerClient] = None
@@ -230,28 +258,342 @@ def _get_client(ctx) -> oc_client.OpenCollectiveClient:
 # ---------------------------------------------------------------------------
 
 
+def _dump(obj: Any) -> str:
+    """Serialize a tool result as indented JSON."""
+    return orjson.dumps(
+        obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def _dump_ndjson(connection: dict[str, Any]) -> str:
+    """Serialize a paginated GraphQL connection as newline-delimited JSON.
+
+    The first line holds the page metadata (totalCount, offset, limit); each
+    following line is one node.
+    """
+    meta = {k: v for k, v in connection.items() if k != "nodes"}
+    lines = [orjson.dumps(meta)]
+    lines.extend(orjson.dumps(node) for node in connection.get("nodes") or ())
+    return b"\n".join(lines).decode()
+
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds the server asked us to wait, from its Retry-After header."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+async def _with_retry(
+    coro_factory: Callable[[], Awaitable[Any]],
+    *,
+    max_retries: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0,
+) -> Any:
+    """Await coro_factory(), retrying transient HTTP failures with backoff.
+
+    Only for idempotent requests: a retried call may have already taken
+    effect on the server.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await coro_factory()
+        except httpx.HTTPStatusError as e:
+            code = e.response.status_code
+            if attempt == max_retries or code not in RETRYABLE_STATUS_CODES:
+                raise
+            delay = _retry_after(e.response)
+        except httpx.TransportError:  # Includes timeouts
+            if attempt == max_retries:
+                raise
+            delay = None
+        if delay is None:
+            delay = base * 2**attempt * (1 + random.random() * 0.5)
+        await asyncio.sleep(min(cap, delay))
+
+
+# Read queries issued within this many seconds of each other are sent
+# together as one batched GraphQL request
+BATCH_WINDOW = 0.005
+
+_PendingQuery = tuple[str, Optional[dict[str, Any]], "asyncio.Future[dict[str, Any]]"]
+_pending_batches: dict[oc_client.OpenCollectiveClient, list[_PendingQuery]] = {}
+# Strong references so flush tasks are not garbage collected mid-flight
+_flush_tasks: set[asyncio.Task[None]] = set()
+
+# Successful read results are reused for this many seconds
+READ_CACHE_TTL = 60.0
+READ_CACHE_SIZE = 512
+# key -> (expiry on the monotonic clock, data); insertion order is LRU order
+_read_cache: dict[bytes, tuple[float, dict[str, Any]]] = {}
+# Bumped by every write; a read that started before a write neither stores
+# its possibly stale result nor is shared with reads started after it
+_read_generation = 0
+
+_ExecuteFn = Callable[
+    [oc_client.OpenCollectiveClient, str, Optional[dict[str, Any]]],
+    Awaitable[dict[str, Any]],
+]
+
+
+def _cache_key(query: str, variables: Optional[dict[str, Any]]) -> bytes:
+    payload = orjson.dumps({"q": query, "v": variables}, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _invalidate_reads() -> None:
+    """Drop cached reads after a write, including those still in flight."""
+    global _read_generation
+    _read_generation += 1
+    _read_cache.clear()
+
+
+def _cached(ttl: float) -> Callable[[_ExecuteFn], _ExecuteFn]:
+    """Cache the results of a read-only execute function for ttl seconds.
+
+    Only anonymous requests are cached: with a personal token the answer
+    may depend on who is asking, so it is always fetched fresh. A result is
+    shared by every caller that gets it from the cache and must not be
+    modified.
+    """
+
+    def decorator(fn: _ExecuteFn) -> _ExecuteFn:
+        @functools.wraps(fn)
+        async def wrapper(
+            cl: oc_client.OpenCollectiveClient,
+            query: str,
+            variables: Optional[dict[str, Any]] = None,
+        ) -> dict[str, Any]:
+            if cl.personal_token or query == queries.GET_LOGGED_IN_ACCOUNT:
+                return await fn(cl, query, variables)
+
+            key = _cache_key(query, variables)
+            hit = _read_cache.pop(key, None)
+            if hit is not None and hit[0] > time.monotonic():
+                _read_cache[key] = hit  # Move to the most recently used end
+                return hit[1]
+
+            generation = _read_generation
+            data = await fn(cl, query, variables)
+            if generation == _read_generation:
+                _read_cache[key] = (time.monotonic() + ttl, data)
+                if len(_read_cache) > READ_CACHE_SIZE:
+                    del _read_cache[next(iter(_read_cache))]
+            return data
+
+        return wrapper
+
+    return decorator
+
+
+# Identical reads currently in flight, shared by every concurrent caller
+_inflight: dict[
+    tuple[oc_client.OpenCollectiveClient, int, bytes], "asyncio.Task[dict[str, Any]]"
+] = {}
+
+
+def _single_flight(fn: _ExecuteFn) -> _ExecuteFn:
+    """Let concurrent identical calls share one request instead of each sending it."""
+
+    @functools.wraps(fn)
+    async def wrapper(
+        cl: oc_client.OpenCollectiveClient,
+        query: str,
+        variables: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        key = (cl, _read_generation, _cache_key(query, variables))
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(cl, query, variables))
+            _inflight[key] = task
+            task.add_done_callback(lambda _: _inflight.pop(key, None))
+        # Shielded so one caller giving up doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+# Parsed invoice PDFs are reused for this many seconds. Only for tools whose
+# client keeps no cache of its own; the invoice list and usage CSVs are
+# already cached by the Hetzner clients.
+TOOL_CACHE_TTL = 30.0
+TOOL_CACHE_SIZE = 256
+# (tool name, serialized arguments) -> (monotonic expiry, result)
+_tool_cache: dict[tuple[str, str], tuple[float, str]] = {}
+
+_ToolFn = Callable[..., Awaitable[str]]
+
+
+def _cache_read(fn: _ToolFn) -> _ToolFn:
+    """Reuse a read-only tool's result for identical arguments.
+
+    Error results are returned but never cached.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        models = [a for a in (*args, *kwargs.values()) if isinstance(a, BaseModel)]
+        key = (fn.__name__, "".join(m.model_dump_json() for m in models))
+        hit = _tool_cache.pop(key, None)
+        if hit is not None and hit[0] > time.monotonic():
+            _tool_cache[key] = hit  # Move to the most recently used end
+            return hit[1]
+
+        result = await fn(*args, **kwargs)
+        if not result.startswith(("Error", "GraphQL error")):
+            _tool_cache[key] = (time.monotonic() + TOOL_CACHE_TTL, result)
+            if len(_tool_cache) > TOOL_CACHE_SIZE:
+                del _tool_cache[next(iter(_tool_cache))]
+        return result
+
+    return wrapper
+
+
+def _guard(fn: _ToolFn) -> _ToolFn:
+    """Return any exception raised by a tool as its error message."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            return _handle_error(e)
+
+    return wrapper
+
+
+async def _mutate(
+    cl: oc_client.OpenCollectiveClient,
+    query: str,
+    variables: Optional[dict[str, Any]] = None,
+    *,
+    retry: bool = True,
+) -> dict[str, Any]:
+    """Execute a mutation, dropping cached reads it may have made stale.
+
+    Pass retry=False for non-idempotent mutations, which must not be resent.
+    """
+    try:
+        if not retry:
+            return await cl.execute(query, variables)
+        return await _with_retry(lambda: cl.execute(query, variables))
+    finally:
+        _invalidate_reads()
+
+
+@_cached(ttl=READ_CACHE_TTL)
+@_single_flight
+async def _execute(
+    cl: oc_client.OpenCollectiveClient,
+    query: str,
+    variables: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """Execute a read-only query, batching it with concurrent ones.
+
+    Mutations go through _mutate() instead and are never batched.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[dict[str, Any]] = loop.create_future()
+    batch = _pending_batches.get(cl)
+    if batch is None:
+        batch = _pending_batches[cl] = []
+        loop.call_later(BATCH_WINDOW, _schedule_flush, cl)
+    batch.append((query, variables, future))
+    return await future
+
+
+def _schedule_flush(cl: oc_client.OpenCollectiveClient) -> None:
+    task = asyncio.ensure_future(_flush_batch(cl))
+    _flush_tasks.add(task)
+    task.add_done_callback(_flush_tasks.discard)
+
+
+async def _flush_batch(cl: oc_client.OpenCollectiveClient) -> None:
+    """Send a client's queued queries and resolve their futures."""
+    batch = _pending_batches.pop(cl, [])
+    results: list[dict[str, Any] | Exception]
+    try:
+        if len(batch) == 1:
+            # Nothing to batch with; a plain request also keeps APQ
+            query, variables, _ = batch[0]
+            results = [await _with_retry(lambda: cl.execute(query, variables))]
+        else:
+            operations = [(q, v) for q, v, _ in batch]
+            results = await _with_retry(lambda: cl.execute_many(operations))
+    except Exception as e:
+        results = [e] * len(batch)
+
+    for (_, _, future), result in zip(batch, results):
+        if future.done():
+            continue  # The caller was cancelled
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+def _collect(
+    params: BaseModel, fields: dict[str, str], skip_empty: bool = False
+) -> dict[str, Any]:
+    """Map set input fields to their GraphQL names.
+
+    Fields that are None are left out, as are empty values if skip_empty.
+    """
+    values = ((gql_key, getattr(params, attr)) for attr, gql_key in fields.items())
+    if skip_empty:
+        return {gql_key: v for gql_key, v in values if v}
+    return {gql_key: v for gql_key, v in values if v is not None}
+
+
 def _fmt_amount(a: dict | None) -> str:
     if not a:
         return "N/A"
-    cents = a.get("valueInCents", 0)
+    cents = int(a.get("valueInCents") or 0)
     cur = a.get("currency", "USD")
-    return f"{cents / 100:.2f} {cur}"
+    # Integer cents formatted directly, without a float round trip
+    sign = "-" if cents < 0 else ""
+    units, rest = divmod(abs(cents), 100)
+    return f"{sign}{units}.{rest:02d} {cur}"
+
+
+_HTTP_MESSAGES: dict[int, str] = {
+    401: "Error: Authentication required. Set OPENCOLLECTIVE_TOKEN environment variable with a personal token.",
+    403: "Error: Permission denied. Check your token has the required scopes.",
+    429: "Error: Rate limit exceeded. Wait before retrying.",
+    503: "Error: Service unavailable. Try again later.",
+}
+
+
+def _http_status_message(e: httpx.HTTPStatusError) -> str:
+    code = e.response.status_code
+    return _HTTP_MESSAGES.get(code, f"Error: HTTP {code}")
+
+
+# Checked in order; the first matching exception type formats the message
+_ERROR_HANDLERS: list[tuple[type[Exception], Callable[[Any], str]]] = [
+    (oc_client.GraphQLError, lambda e: f"GraphQL error: {e}"),
+    (httpx.HTTPStatusError, _http_status_message),
+    (httpx.TimeoutException, lambda e: "Error: Request timed out."),
+]
 
 
 def _handle_error(e: Exception) -> str:
-    if isinstance(e, oc_client.GraphQLError):
-        return f"GraphQL error: {e}"
-    if isinstance(e, httpx.HTTPStatusError):
-        code = e.response.status_code
-        if code == 401:
-            return "Error: Authentication required. Set OPENCOLLECTIVE_TOKEN environment variable with a personal token."
-        if code == 403:
-            return "Error: Permission denied. Check your token has the required scopes."
-        if code == 429:
-            return "Error: Rate limit exceeded. Wait before retrying."
-        return f"Error: HTTP {code}"
-    if isinstance(e, httpx.TimeoutException):
-        return "Error: Request timed out."
+    for exc_type, handler in _ERROR_HANDLERS:
+        if isinstance(e, exc_type):
+            return handler(e)
     return f"Error: {type(e).__name__}: {e}"
 
 
@@ -260,8 +602,42 @@ def _handle_error(e: Exception) -> str:
 # ---------------------------------------------------------------------------
 
 
+# Enum-like string normalized to upper case during validation
+_Upper = Annotated[str, AfterValidator(str.upper)]
+
+_VALID_EXPENSE_TYPES = frozenset(
+    {
+        "INVOICE",
+        "RECEIPT",
+        "FUNDING_REQUEST",
+        "GRANT",
+        "UNCLASSIFIED",
+        "CHARGE",
+    }
+)
+_VALID_EXPENSE_TYPES_ERR = ", ".join(sorted(_VALID_EXPENSE_TYPES))
+
+_VALID_ACTIONS = frozenset(
+    {
+        "APPROVE",
+        "UNAPPROVE",
+        "REQUEST_RE_APPROVAL",
+        "REJECT",
+        "MARK_AS_UNPAID",
+        "SCHEDULE_FOR_PAYMENT",
+        "UNSCHEDULE_PAYMENT",
+        "PAY",
+        "MARK_AS_SPAM",
+        "MARK_AS_INCOMPLETE",
+        "HOLD",
+        "RELEASE",
+    }
+)
+_VALID_ACTIONS_ERR = ", ".join(sorted(_VALID_ACTIONS))
+
+
 class AccountRefInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     slug: Optional[str] = Field(
         default=None, description="Account slug (e.g. 'goingdark')"
     )
@@ -269,16 +645,16 @@ class AccountRefInput(BaseModel):
 
 
 class GetAccountInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     slug: str = Field(
         ..., description="The collective/account slug (e.g. 'goingdark')", min_length=1
     )
 
 
 class SearchAccountsInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     search_term: Optional[str] = Field(default=None, description="Search query string")
-    account_type: Optional[str] = Field(
+    account_type: Optional[_Upper] = Field(
         default=None,
         description="Filter by type: COLLECTIVE, ORGANIZATION, INDIVIDUAL, FUND, PROJECT, EVENT",
     )
@@ -287,25 +663,33 @@ class SearchAccountsInput(BaseModel):
 
 
 class GetMembersInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     slug: str = Field(..., description="Account slug", min_length=1)
     limit: int = Field(default=20, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
 
 
+class BootstrapContextInput(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
+    slug: str = Field(..., description="Account slug (e.g. 'goingdark')", min_length=1)
+    limit: int = Field(
+        default=20, ge=1, le=100, description="Members and expenses to include"
+    )
+
+
 class ListExpensesInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     account_slug: Optional[str] = Field(
         default=None, description="Collective slug to list expenses for"
     )
     from_account_slug: Optional[str] = Field(
         default=None, description="Filter by payee slug"
     )
-    status: Optional[list[str]] = Field(
+    status: Optional[list[_Upper]] = Field(
         default=None,
         description="Filter by status(es): DRAFT, PENDING, APPROVED, REJECTED, PAID, PROCESSING, ERROR, SCHEDULED_FOR_PAYMENT, CANCELED, INCOMPLETE, UNVERIFIED, SPAM",
     )
-    expense_type: Optional[str] = Field(
+    expense_type: Optional[_Upper] = Field(
         default=None,
         description="Filter by type: INVOICE, RECEIPT, FUNDING_REQUEST, GRANT, UNCLASSIFIED, CHARGE",
     )
@@ -320,7 +704,7 @@ class ListExpensesInput(BaseModel):
 
 
 class GetExpenseInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     id: Optional[str] = Field(default=None, description="Expense ID (string)")
     legacy_id: Optional[int] = Field(
         default=None, description="Expense legacy ID (integer)"
@@ -328,6 +712,7 @@ class GetExpenseInput(BaseModel):
 
 
 class ExpenseItemInput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     description: str = Field(..., description="Item description", min_length=1)
     amount_cents: int = Field(
         ..., description="Amount in cents (e.g. 5000 for $50.00)", gt=0
@@ -342,7 +727,7 @@ class ExpenseItemInput(BaseModel):
 
 
 class CreateExpenseInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     account_slug: str = Field(
         ...,
         description="Collective slug to submit expense to (e.g. 'goingdark')",
@@ -385,55 +770,65 @@ class CreateExpenseInput(BaseModel):
     reference: Optional[str] = Field(
         default=None, description="External reference number"
     )
-    recurring_interval: Optional[str] = Field(
+    recurring_interval: Optional[_Upper] = Field(
         default=None, description="Recurring interval: MONTH, QUARTER, YEAR"
     )
 
     @field_validator("expense_type")
     @classmethod
     def validate_expense_type(cls, v: str) -> str:
-        valid = {
-            "INVOICE",
-            "RECEIPT",
-            "FUNDING_REQUEST",
-            "GRANT",
-            "UNCLASSIFIED",
-            "CHARGE",
-        }
         v = v.upper()
-        if v not in valid:
+        if v not in _VALID_EXPENSE_TYPES:
             raise ValueError(
-                f"Invalid expense type '{v}'. Must be one of: {', '.join(sorted(valid))}"
+                f"Invalid expense type '{v}'. Must be one of: {_VALID_EXPENSE_TYPES_ERR}"
             )
         return v
 
 
+class CreateExpensesBatchInput(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
+    expenses: list[CreateExpenseInput] = Field(
+        ...,
+        description="Expenses to submit, each as for oc_create_expense",
+        min_length=1,
+        max_length=25,
+    )
+
+
 class EditExpenseInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     id: str = Field(..., description="Expense ID to edit", min_length=1)
     description: Optional[str] = Field(default=None, description="New description")
     long_description: Optional[str] = Field(
-        default=None, description="New detailed description"
+        default=None,
+        description="New detailed description",
+        serialization_alias="longDescription",
     )
     tags: Optional[list[str]] = Field(default=None, description="New tags")
     private_message: Optional[str] = Field(
-        default=None, description="New private message"
+        default=None,
+        description="New private message",
+        serialization_alias="privateMessage",
+    )
+    invoice_info: Optional[str] = Field(
+        default=None, description="New invoice info", serialization_alias="invoiceInfo"
     )
-    invoice_info: Optional[str] = Field(default=None, description="New invoice info")
     reference: Optional[str] = Field(default=None, description="New reference number")
-    expense_type: Optional[str] = Field(
-        default=None, description="New type: INVOICE, RECEIPT, etc."
+    expense_type: Optional[_Upper] = Field(
+        default=None,
+        description="New type: INVOICE, RECEIPT, etc.",
+        serialization_alias="type",
     )
 
 
 class DeleteExpenseInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     id: Optional[str] = Field(default=None, description="Expense ID")
     legacy_id: Optional[int] = Field(default=None, description="Expense legacy ID")
 
 
 class ProcessExpenseInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     id: Optional[str] = Field(default=None, description="Expense ID")
     legacy_id: Optional[int] = Field(default=None, description="Expense legacy ID")
     action: str = Field(
@@ -445,38 +840,26 @@ class ProcessExpenseInput(BaseModel):
     @field_validator("action")
     @classmethod
     def validate_action(cls, v: str) -> str:
-        valid = {
-            "APPROVE",
-            "UNAPPROVE",
-            "REQUEST_RE_APPROVAL",
-            "REJECT",
-            "MARK_AS_UNPAID",
-            "SCHEDULE_FOR_PAYMENT",
-            "UNSCHEDULE_PAYMENT",
-            "PAY",
-            "MARK_AS_SPAM",
-            "MARK_AS_INCOMPLETE",
-            "HOLD",
-            "RELEASE",
-        }
         v = v.upper()
-        if v not in valid:
+        if v not in _VALID_ACTIONS:
             raise ValueError(
-                f"Invalid action '{v}'. Must be one of: {', '.join(sorted(valid))}"
+                f"Invalid action '{v}'. Must be one of: {_VALID_ACTIONS_ERR}"
             )
         return v
 
 
 class ListTransactionsInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     account_slug: Optional[str] = Field(
         default=None, description="Account slug to list transactions for"
     )
-    transaction_type: Optional[str] = Field(default=None, description="CREDIT or DEBIT")
+    transaction_type: Optional[_Upper] = Field(
+        default=None, description="CREDIT or DEBIT"
+    )
     date_from: Optional[str] = Field(default=None, description="Start date (ISO 8601)")
     date_to: Optional[str] = Field(default=None, description="End date (ISO 8601)")
     search_term: Optional[str] = Field(default=None, description="Search term")
-    kind: Optional[list[str]] = Field(
+    kind: Optional[list[_Upper]] = Field(
         default=None,
         description="Filter by kind: CONTRIBUTION, EXPENSE, ADDED_FUNDS, HOST_FEE, PAYMENT_PROCESSOR_FEE, etc.",
     )
@@ -485,26 +868,30 @@ class ListTransactionsInput(BaseModel):
 
 
 class EditAccountInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     id: str = Field(
         ...,
         description="Account ID to edit (required, get it from oc_get_account first)",
         min_length=1,
     )
     name: Optional[str] = Field(default=None, description="New display name")
-    legal_name: Optional[str] = Field(default=None, description="New legal name")
+    legal_name: Optional[str] = Field(
+        default=None, description="New legal name", serialization_alias="legalName"
+    )
     description: Optional[str] = Field(
         default=None, description="New short description"
     )
     long_description: Optional[str] = Field(
-        default=None, description="New long description (markdown)"
+        default=None,
+        description="New long description (markdown)",
+        serialization_alias="longDescription",
     )
     tags: Optional[list[str]] = Field(default=None, description="New tags")
     currency: Optional[str] = Field(default=None, description="New currency code")
 
 
 class EditAccountSettingInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     slug: str = Field(
         ..., description="Account slug to edit settings for", min_length=1
     )
@@ -517,7 +904,7 @@ class EditAccountSettingInput(BaseModel):
 
 
 class SetBudgetInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     slug: str = Field(..., description="Account slug (e.g. 'goingdark')", min_length=1)
     amount: int = Field(
         ..., description="Budget amount in EUR (e.g. 800 for €800/year)", ge=1
@@ -528,7 +915,7 @@ class SetBudgetInput(BaseModel):
 
 
 class ExecuteGraphQLInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     query: str = Field(
         ..., description="Raw GraphQL query or mutation string", min_length=1
     )
@@ -544,6 +931,7 @@ class ExecuteGraphQLInput(BaseModel):
 
 @mcp.tool(
     name="oc_get_account",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -555,25 +943,24 @@ class ExecuteGraphQLInput(BaseModel):
         },
     ),
 )
+@_guard
 async def oc_get_account(params: GetAccountInput, ctx=None) -> str:
     """Get detailed information about an OpenCollective account/collective by slug.
 
     Returns account profile, stats (balance, budget, total received/spent),
     social links, and metadata. Works without authentication for public data.
     """
-    try:
-        cl = _get_client(ctx)
-        data = await cl.execute(queries.GET_ACCOUNT, {"slug": params.slug})
-        account = data.get("account")
-        if not account:
-            return f"No account found with slug '{params.slug}'"
-        return json.dumps(account, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    data = await _execute(cl, queries.GET_ACCOUNT, {"slug": params.slug})
+    account = data.get("account")
+    if not account:
+        return f"No account found with slug '{params.slug}'"
+    return _dump(account)
 
 
 @mcp.tool(
     name="oc_search_accounts",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -585,30 +972,29 @@ async def oc_get_account(params: GetAccountInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_search_accounts(params: SearchAccountsInput, ctx=None) -> str:
     """Search for OpenCollective accounts/collectives.
 
     Supports filtering by search term and account type
     (COLLECTIVE, ORGANIZATION, INDIVIDUAL, FUND, PROJECT, EVENT).
     """
-    try:
-        cl = _get_client(ctx)
-        variables: dict[str, Any] = {
-            "limit": params.limit,
-            "offset": params.offset,
-        }
-        if params.search_term:
-            variables["searchTerm"] = params.search_term
-        if params.account_type:
-            variables["type"] = [params.account_type.upper()]
-        data = await cl.execute(queries.SEARCH_ACCOUNTS, variables)
-        return json.dumps(data.get("accounts", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    variables: dict[str, Any] = {
+        "limit": params.limit,
+        "offset": params.offset,
+    }
+    if params.search_term:
+        variables["searchTerm"] = params.search_term
+    if params.account_type:
+        variables["type"] = [params.account_type]
+    data = await _execute(cl, queries.SEARCH_ACCOUNTS, variables)
+    return _dump(data.get("accounts", {}))
 
 
 @mcp.tool(
     name="oc_get_logged_in_account",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -620,23 +1006,22 @@ async def oc_search_accounts(params: SearchAccountsInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_get_logged_in_account(ctx=None) -> str:
     """Get information about the currently authenticated account.
 
     Requires OPENCOLLECTIVE_TOKEN to be set.
     """
-    try:
-        cl = _get_client(ctx)
-        if not cl.personal_token:
-            return "Error: No authentication token set. Set OPENCOLLECTIVE_TOKEN environment variable."
-        data = await cl.execute(queries.GET_LOGGED_IN_ACCOUNT)
-        return json.dumps(data.get("loggedInAccount", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    if not cl.personal_token:
+        return "Error: No authentication token set. Set OPENCOLLECTIVE_TOKEN environment variable."
+    data = await _execute(cl, queries.GET_LOGGED_IN_ACCOUNT, None)
+    return _dump(data.get("loggedInAccount", {}))
 
 
 @mcp.tool(
     name="oc_edit_account",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -648,36 +1033,26 @@ async def oc_get_logged_in_account(ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_edit_account(params: EditAccountInput, ctx=None) -> str:
     """Edit an OpenCollective account/collective profile.
 
     Requires authentication. Use oc_get_account first to obtain the account ID.
     Only provided fields will be updated.
     """
-    try:
-        cl = _get_client(ctx)
-        account_input: dict[str, Any] = {"id": params.id}
-        if params.name is not None:
-            account_input["name"] = params.name
-        if params.legal_name is not None:
-            account_input["legalName"] = params.legal_name
-        if params.description is not None:
-            account_input["description"] = params.description
-        if params.long_description is not None:
-            account_input["longDescription"] = params.long_description
-        if params.tags is not None:
-            account_input["tags"] = params.tags
-        if params.currency is not None:
-            account_input["currency"] = params.currency
-
-        data = await cl.execute(queries.EDIT_ACCOUNT, {"account": account_input})
-        return json.dumps(data.get("editAccount", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    account_input: dict[str, Any] = {
+        "id": params.id,
+        **params.model_dump(by_alias=True, exclude_none=True, exclude={"id"}),
+    }
+
+    data = await _mutate(cl, queries.EDIT_ACCOUNT, {"account": account_input})
+    return _dump(data.get("editAccount", {}))
 
 
 @mcp.tool(
     name="oc_edit_account_setting",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -689,6 +1064,7 @@ async def oc_edit_account(params: EditAccountInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_edit_account_setting(params: EditAccountSettingInput, ctx=None) -> str:
     """Edit an account setting like monthly spending limits.
 
@@ -698,21 +1074,23 @@ async def oc_edit_account_setting(params: EditAccountSettingInput, ctx=None) ->
     - 'VIRTUAL_CARDS_MAX_MONTHLY_AMOUNT': Max monthly virtual card spending
     - 'VIRTUAL_CARDS_MAX_DAILY_AMOUNT': Max daily virtual card spending
     """
-    try:
-        cl = _get_client(ctx)
-        variables = {
-            "account": {"slug": params.slug},
-            "key": params.key,
-            "value": params.value,
-        }
-        data = await cl.execute(queries.EDIT_ACCOUNT_SETTING, variables)
-        return json.dumps(data.get("editAccountSetting", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    variables = {
+        "account": {"slug": params.slug},
+        "key": params.key,
+        "value": params.value,
+    }
+    data = await _mutate(cl, queries.EDIT_ACCOUNT_SETTING, variables)
+    return _dump(data.get("editAccountSetting", {}))
+
+
+# Fixed fields of the goal oc_set_budget writes; title and amount vary
+_BUDGET_GOAL = {"type": "yearlyBudget", "currency": "EUR"}
 
 
 @mcp.tool(
     name="oc_set_budget",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -724,30 +1102,26 @@ async def oc_edit_account_setting(params: EditAccountSettingInput, ctx=None) ->
         },
     ),
 )
+@_guard
 async def oc_set_budget(params: SetBudgetInput, ctx=None) -> str:
     """Set the yearly budget goal for a collective.
 
     Example: Set 800 EUR yearly budget for goingdark collective.
     Requires token with 'account' scope.
     """
-    try:
-        cl = _get_client(ctx)
-        variables = {
-            "account": {"slug": params.slug},
-            "key": "goals",
-            "value": [
-                {
-                    "type": "yearlyBudget",
-                    "title": params.title,
-                    "amount": params.amount * 100,  # Convert to cents
-                    "currency": "EUR",
-                }
-            ],
-        }
-        data = await cl.execute(queries.EDIT_ACCOUNT_SETTING, variables)
-        return json.dumps(data.get("editAccountSetting", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    goal = {
+        **_BUDGET_GOAL,
+        "title": params.title,
+        "amount": params.amount * 100,  # Convert to cents
+    }
+    variables = {
+        "account": {"slug": params.slug},
+        "key": "goals",
+        "value": [goal],
+    }
+    data = await _mutate(cl, queries.EDIT_ACCOUNT_SETTING, variables)
+    return _dump(data.get("editAccountSetting", {}))
 
 
 # ---------------------------------------------------------------------------
@@ -757,6 +1131,7 @@ async def oc_set_budget(params: SetBudgetInput, ctx=None) -> str:
 
 @mcp.tool(
     name="oc_get_members",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -768,26 +1143,78 @@ async def oc_set_budget(params: SetBudgetInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_get_members(params: GetMembersInput, ctx=None) -> str:
     """List members and backers of an OpenCollective account.
 
     Returns member roles (ADMIN, MEMBER, BACKER, etc.), donation totals,
     and linked account info.
     """
-    try:
-        cl = _get_client(ctx)
-        data = await cl.execute(
+    cl = _get_client(ctx)
+    data = await _execute(
+        cl,
+        queries.GET_MEMBERS,
+        {
+            "slug": params.slug,
+            "limit": params.limit,
+            "offset": params.offset,
+        },
+    )
+    members = data.get("account", {}).get("members", {})
+    return _dump(members)
+
+
+@mcp.tool(
+    name="oc_bootstrap_context",
+    structured_output=False,
+    annotations=cast(
+        ToolAnnotations,
+        {
+            "title": "Get Account Overview",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": True,
+        },
+    ),
+)
+@_guard
+async def oc_bootstrap_context(params: BootstrapContextInput, ctx=None) -> str:
+    """Get an account's details, members and recent expenses in one call.
+
+    Equivalent to oc_get_account, oc_get_members and oc_list_expenses, but
+    the three queries run concurrently. A part that fails is reported as an
+    error string in its place without failing the others.
+    """
+    cl = _get_client(ctx)
+
+    async def fetch(
+        query: str, variables: dict[str, Any], extract: Callable[[dict[str, Any]], Any]
+    ) -> Any:
+        try:
+            return extract(await _execute(cl, query, variables))
+        except Exception as e:
+            return _handle_error(e)
+
+    page = {"limit": params.limit, "offset": 0}
+    account, members, expenses = await asyncio.gather(
+        fetch(
+            queries.GET_ACCOUNT,
+            {"slug": params.slug},
+            lambda d: d.get("account"),
+        ),
+        fetch(
             queries.GET_MEMBERS,
-            {
-                "slug": params.slug,
-                "limit": params.limit,
-                "offset": params.offset,
-            },
-        )
-        members = data.get("account", {}).get("members", {})
-        return json.dumps(members, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+            {"slug": params.slug, **page},
+            lambda d: (d.get("account") or {}).get("members", {}),
+        ),
+        fetch(
+            queries.LIST_EXPENSES,
+            {"account": {"slug": params.slug}, **page},
+            lambda d: d.get("expenses", {}),
+        ),
+    )
+    return _dump({"account": account, "members": members, "expenses": expenses})
 
 
 # ---------------------------------------------------------------------------
@@ -795,8 +1222,20 @@ async def oc_get_members(params: GetMembersInput, ctx=None) -> str:
 # ---------------------------------------------------------------------------
 
 
+# Input field -> GraphQL field copied verbatim when set
+_LIST_EXPENSES_FIELDS = {
+    "status": "status",
+    "expense_type": "type",
+    "tag": "tag",
+    "date_from": "dateFrom",
+    "date_to": "dateTo",
+    "search_term": "searchTerm",
+}
+
+
 @mcp.tool(
     name="oc_list_expenses",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -808,43 +1247,34 @@ async def oc_get_members(params: GetMembersInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_list_expenses(params: ListExpensesInput, ctx=None) -> str:
     """List expenses for an OpenCollective account with filtering.
 
     Supports filtering by status, type, tags, date range, and search term.
     Use account_slug to filter by collective, from_account_slug to filter by payee.
+
+    Returns NDJSON: a first line with totalCount/offset/limit, then one
+    expense per line.
     """
-    try:
-        cl = _get_client(ctx)
-        variables: dict[str, Any] = {
-            "limit": params.limit,
-            "offset": params.offset,
-        }
-        if params.account_slug:
-            variables["account"] = {"slug": params.account_slug}
-        if params.from_account_slug:
-            variables["fromAccount"] = {"slug": params.from_account_slug}
-        if params.status:
-            variables["status"] = [s.upper() for s in params.status]
-        if params.expense_type:
-            variables["type"] = params.expense_type.upper()
-        if params.tag:
-            variables["tag"] = params.tag
-        if params.date_from:
-            variables["dateFrom"] = params.date_from
-        if params.date_to:
-            variables["dateTo"] = params.date_to
-        if params.search_term:
-            variables["searchTerm"] = params.search_term
-
-        data = await cl.execute(queries.LIST_EXPENSES, variables)
-        return json.dumps(data.get("expenses", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    variables: dict[str, Any] = {
+        "limit": params.limit,
+        "offset": params.offset,
+    }
+    if params.account_slug:
+        variables["account"] = {"slug": params.account_slug}
+    if params.from_account_slug:
+        variables["fromAccount"] = {"slug": params.from_account_slug}
+    variables.update(_collect(params, _LIST_EXPENSES_FIELDS, skip_empty=True))
+
+    data = await _execute(cl, queries.LIST_EXPENSES, variables)
+    return _dump_ndjson(data.get("expenses") or {})
 
 
 @mcp.tool(
     name="oc_get_expense",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -856,25 +1286,115 @@ async def oc_list_expenses(params: ListExpensesInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_get_expense(params: GetExpenseInput, ctx=None) -> str:
     """Get detailed information about a specific expense by ID or legacy ID."""
-    try:
-        cl = _get_client(ctx)
-        variables: dict[str, Any] = {}
-        if params.id:
-            variables["id"] = params.id
-        if params.legacy_id:
-            variables["legacyId"] = params.legacy_id
-        if not variables:
-            return "Error: Provide either 'id' or 'legacy_id'"
-        data = await cl.execute(queries.GET_EXPENSE, variables)
-        return json.dumps(data.get("expense", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    variables: dict[str, Any] = {}
+    if params.id:
+        variables["id"] = params.id
+    if params.legacy_id:
+        variables["legacyId"] = params.legacy_id
+    if not variables:
+        return "Error: Provide either 'id' or 'legacy_id'"
+    data = await _execute(cl, queries.GET_EXPENSE, variables)
+    return _dump(data.get("expense", {}))
+
+
+_PAYOUT_METHOD_FIELDS = {
+    "payout_method_id": "id",
+    "payout_method_type": "type",
+    "payout_method_data": "data",
+}
+
+# Used when no payout method is given; ACCOUNT_BALANCE pays from the
+# collective balance. Read-only so a request can never alter the default.
+_DEFAULT_PAYOUT_METHOD = MappingProxyType({"type": "ACCOUNT_BALANCE"})
+
+_CREATE_EXPENSE_FIELDS = {
+    "currency": "currency",
+    "long_description": "longDescription",
+    "tags": "tags",
+    "private_message": "privateMessage",
+    "invoice_info": "invoiceInfo",
+    "reference": "reference",
+}
+
+
+def _expense_item(item: ExpenseItemInput) -> dict[str, Any]:
+    """Build the GraphQL input for one expense line item."""
+    item_data: dict[str, Any] = {
+        "description": item.description,
+        "amountV2": {
+            "valueInCents": item.amount_cents,
+            "currency": item.currency,
+        },
+    }
+    if item.url:
+        item_data["url"] = item.url
+    if item.incurred_at:
+        # Ensure ISO 8601 datetime format; a bare YYYY-MM-DD means midnight UTC
+        incurred = item.incurred_at
+        item_data["incurredAt"] = (
+            incurred + "T00:00:00Z" if len(incurred) == 10 else incurred
+        )
+    return item_data
+
+
+def _create_expense_variables(params: CreateExpenseInput) -> dict[str, Any]:
+    """Build the createExpense variables for one expense."""
+    expense_input: dict[str, Any] = {
+        "description": params.description,
+        "type": params.expense_type,
+        "payee": {"slug": params.payee_slug},
+        "items": [_expense_item(item) for item in params.items],
+    }
+
+    # Payout method; the copy keeps the variables JSON-serializable
+    expense_input["payoutMethod"] = _collect(
+        params, _PAYOUT_METHOD_FIELDS, skip_empty=True
+    ) or dict(_DEFAULT_PAYOUT_METHOD)
+
+    expense_input.update(_collect(params, _CREATE_EXPENSE_FIELDS, skip_empty=True))
+
+    variables: dict[str, Any] = {
+        "expense": expense_input,
+        "account": {"slug": params.account_slug},
+    }
+
+    if params.recurring_interval:
+        variables["recurring"] = {"interval": params.recurring_interval}
+    return variables
+
+
+# A resubmission of an identical expense within this many seconds returns the
+# expense created the first time instead of creating a duplicate
+DUPLICATE_EXPENSE_WINDOW = 600.0
+RECENT_EXPENSES_SIZE = 256
+# Digest of the createExpense variables -> (monotonic time created, expense id)
+_recent_expenses: dict[bytes, tuple[float, str]] = {}
+
+
+def _recent_expense_id(key: bytes) -> Optional[str]:
+    """Id of an expense created from the same variables within the window."""
+    hit = _recent_expenses.get(key)
+    if hit is None:
+        return None
+    if time.monotonic() - hit[0] > DUPLICATE_EXPENSE_WINDOW:
+        del _recent_expenses[key]
+        return None
+    return hit[1]
+
+
+def _remember_expense(key: bytes, expense_id: str) -> None:
+    _recent_expenses[key] = (time.monotonic(), expense_id)
+    if len(_recent_expenses) > RECENT_EXPENSES_SIZE:
+        del _recent_expenses[next(iter(_recent_expenses))]
 
 
 @mcp.tool(
     name="oc_create_expense",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -886,6 +1406,7 @@ async def oc_get_expense(params: GetExpenseInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_create_expense(params: CreateExpenseInput, ctx=None) -> str:
     """Submit a new expense to an OpenCollective collective.
 
@@ -897,78 +1418,134 @@ async def oc_create_expense(params: CreateExpenseInput, ctx=None) -> str:
 
     For bookkeeping expenses (e.g. when collective has negative balance),
     submit as INVOICE type.
+
+    Resubmitting an identical expense within 10 minutes returns the id of the
+    one already created instead of creating a duplicate.
     """
-    try:
-        cl = _get_client(ctx)
-
-        items = []
-        for item in params.items:
-            item_data: dict[str, Any] = {
-                "description": item.description,
-                "amountV2": {
-                    "valueInCents": item.amount_cents,
-                    "currency": item.currency,
-                },
-            }
-            if item.url:
-                item_data["url"] = item.url
-            if item.incurred_at:
-                # Ensure ISO 8601 datetime format
-                incurred = item.incurred_at
-                if len(incurred) == 10:  # YYYY-MM-DD format
-                    incurred = f"{incurred}T00:00:00Z"
-                item_data["incurredAt"] = incurred
-            items.append(item_data)
-
-        expense_input: dict[str, Any] = {
-            "description": params.description,
-            "type": params.expense_type,
-            "payee": {"slug": params.payee_slug},
-            "items": items,
-        }
+    cl = _get_client(ctx)
+    variables = _create_expense_variables(params)
+
+    key = _cache_key(queries.CREATE_EXPENSE, variables)
+    previous_id = _recent_expense_id(key)
+    if previous_id is not None:
+        return (
+            "Duplicate submission detected; returning previous expense id "
+            f"{previous_id}"
+        )
 
-        # Payout method
-        payout: dict[str, Any] = {}
-        if params.payout_method_id:
-            payout["id"] = params.payout_method_id
-        if params.payout_method_type:
-            payout["type"] = params.payout_method_type
-        if params.payout_method_data:
-            payout["data"] = params.payout_method_data
-        if not payout:
-            # Default to ACCOUNT_BALANCE for collectives
-            payout = {"type": "ACCOUNT_BALANCE"}
-        expense_input["payoutMethod"] = payout
-
-        if params.currency:
-            expense_input["currency"] = params.currency
-        if params.long_description:
-            expense_input["longDescription"] = params.long_description
-        if params.tags:
-            expense_input["tags"] = params.tags
-        if params.private_message:
-            expense_input["privateMessage"] = params.private_message
-        if params.invoice_info:
-            expense_input["invoiceInfo"] = params.invoice_info
-        if params.reference:
-            expense_input["reference"] = params.reference
-
-        variables: dict[str, Any] = {
-            "expense": expense_input,
-            "account": {"slug": params.account_slug},
-        }
+    data = await _mutate(cl, queries.CREATE_EXPENSE, variables, retry=False)
+    expense = data.get("createExpense") or {}
+    if expense.get("id"):
+        _remember_expense(key, expense["id"])
+    return _dump(expense)
 
-        if params.recurring_interval:
-            variables["recurring"] = {"interval": params.recurring_interval.upper()}
 
-        data = await cl.execute(queries.CREATE_EXPENSE, variables)
-        return json.dumps(data.get("createExpense", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+@mcp.tool(
+    name="oc_create_expenses_batch",
+    structured_output=False,
+    annotations=cast(
+        ToolAnnotations,
+        {
+            "title": "Create/Submit Several Expenses",
+            "readOnlyHint": False,
+            "destructiveHint": False,
+            "idempotentHint": False,
+            "openWorldHint": True,
+        },
+    ),
+)
+@_guard
+async def oc_create_expenses_batch(params: CreateExpensesBatchInput, ctx=None) -> str:
+    """Submit several expenses in a single GraphQL request.
+
+    Each expense takes the same fields as oc_create_expense. All of them are
+    sent as one mutation, so K expenses cost one round trip instead of K.
+
+    Returns {"results": [...]} with one result per expense, in order:
+    {"expense": ...} if created, {"error": ...} if that expense failed (the
+    others are unaffected), {"duplicate_of": id} if an identical expense was
+    created in the last 10 minutes or earlier in this batch and was not sent
+    again, or {"unconfirmed": ...} if the API returned neither a result nor
+    an error for it. Errors that concern the request rather than one expense
+    are listed under "errors".
+    """
+    cl = _get_client(ctx)
+    results: list[dict[str, Any]] = []
+    # alias -> (index in results, duplicate-detection key)
+    pending: dict[str, tuple[int, bytes]] = {}
+    # duplicate-detection key -> index of its first occurrence in this batch
+    first_index: dict[bytes, int] = {}
+    # (index of a repeat within this batch, index of its first occurrence)
+    repeats: list[tuple[int, int]] = []
+    variables: dict[str, Any] = {}
+    request_errors: list[str] = []
+    for expense in params.expenses:
+        expense_vars = _create_expense_variables(expense)
+        key = _cache_key(queries.CREATE_EXPENSE, expense_vars)
+        previous_id = _recent_expense_id(key)
+        if previous_id is not None:
+            results.append({"duplicate_of": previous_id})
+            continue
+        if key in first_index:
+            repeats.append((len(results), first_index[key]))
+            results.append({})
+            continue
+        first_index[key] = len(results)
+        alias = f"e{len(pending)}"
+        pending[alias] = (len(results), key)
+        results.append({})
+        variables[f"{alias}_expense"] = expense_vars["expense"]
+        variables[f"{alias}_account"] = expense_vars["account"]
+
+    if pending:
+        query = queries.create_expenses_batch(len(pending))
+        try:
+            # Raw, so one failed expense doesn't hide the ones created
+            response = orjson.loads(await cl.execute_raw(query, variables))
+        finally:
+            _invalidate_reads()
+
+        errors: dict[str, str] = {}
+        for error in response.get("errors") or []:
+            message = error.get("message", str(error))
+            path = error.get("path")
+            if path and str(path[0]) in pending:
+                errors.setdefault(str(path[0]), message)
+            else:
+                request_errors.append(message)
+        data = response.get("data")
+        for alias, (index, key) in pending.items():
+            created = (data or {}).get(alias)
+            if created:
+                if created.get("id"):
+                    _remember_expense(key, created["id"])
+                results[index] = {"expense": created}
+            elif alias in errors:
+                results[index] = {"error": f"GraphQL error: {errors[alias]}"}
+            elif data is None:
+                # Rejected as a whole (e.g. invalid input); nothing was run
+                results[index] = {"error": "Not created; see errors"}
+            else:
+                results[index] = {
+                    "unconfirmed": "No result returned; it may have been "
+                    "created. Check with oc_list_expenses before resubmitting."
+                }
+
+    for index, original in repeats:
+        created = results[original].get("expense") or {}
+        results[index] = (
+            {"duplicate_of": created["id"]} if created.get("id") else results[original]
+        )
+
+    batch: dict[str, Any] = {"results": results}
+    if request_errors:
+        batch["errors"] = request_errors
+    return _dump(batch)
 
 
 @mcp.tool(
     name="oc_edit_expense",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -980,37 +1557,25 @@ async def oc_create_expense(params: CreateExpenseInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_edit_expense(params: EditExpenseInput, ctx=None) -> str:
     """Edit an existing expense. Only provided fields will be updated.
 
     Requires authentication and appropriate permissions.
     """
-    try:
-        cl = _get_client(ctx)
-        expense_input: dict[str, Any] = {"id": params.id}
-        if params.description is not None:
-            expense_input["description"] = params.description
-        if params.long_description is not None:
-            expense_input["longDescription"] = params.long_description
-        if params.tags is not None:
-            expense_input["tags"] = params.tags
-        if params.private_message is not None:
-            expense_input["privateMessage"] = params.private_message
-        if params.invoice_info is not None:
-            expense_input["invoiceInfo"] = params.invoice_info
-        if params.reference is not None:
-            expense_input["reference"] = params.reference
-        if params.expense_type is not None:
-            expense_input["type"] = params.expense_type.upper()
-
-        data = await cl.execute(queries.EDIT_EXPENSE, {"expense": expense_input})
-        return json.dumps(data.get("editExpense", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    expense_input: dict[str, Any] = {
+        "id": params.id,
+        **params.model_dump(by_alias=True, exclude_none=True, exclude={"id"}),
+    }
+
+    data = await _mutate(cl, queries.EDIT_EXPENSE, {"expense": expense_input})
+    return _dump(data.get("editExpense", {}))
 
 
 @mcp.tool(
     name="oc_delete_expense",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1022,25 +1587,24 @@ async def oc_edit_expense(params: EditExpenseInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_delete_expense(params: DeleteExpenseInput, ctx=None) -> str:
     """Delete an expense. Requires authentication and appropriate permissions."""
-    try:
-        cl = _get_client(ctx)
-        variables: dict[str, Any] = {}
-        if params.id:
-            variables["id"] = params.id
-        if params.legacy_id:
-            variables["legacyId"] = params.legacy_id
-        if not variables:
-            return "Error: Provide either 'id' or 'legacy_id'"
-        data = await cl.execute(queries.DELETE_EXPENSE, variables)
-        return json.dumps(data.get("deleteExpense", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    variables: dict[str, Any] = {}
+    if params.id:
+        variables["id"] = params.id
+    if params.legacy_id:
+        variables["legacyId"] = params.legacy_id
+    if not variables:
+        return "Error: Provide either 'id' or 'legacy_id'"
+    data = await _mutate(cl, queries.DELETE_EXPENSE, variables)
+    return _dump(data.get("deleteExpense", {}))
 
 
 @mcp.tool(
     name="oc_process_expense",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1052,6 +1616,7 @@ async def oc_delete_expense(params: DeleteExpenseInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_process_expense(params: ProcessExpenseInput, ctx=None) -> str:
     """Process an expense: approve, reject, pay, hold, release, etc.
 
@@ -1061,21 +1626,18 @@ async def oc_process_expense(params: ProcessExpenseInput, ctx=None) -> str:
 
     Requires authentication and admin/host permissions.
     """
-    try:
-        cl = _get_client(ctx)
-        variables: dict[str, Any] = {"action": params.action}
-        if params.id:
-            variables["id"] = params.id
-        if params.legacy_id:
-            variables["legacyId"] = params.legacy_id
-        if params.message:
-            variables["message"] = params.message
-        if not params.id and not params.legacy_id:
-            return "Error: Provide either 'id' or 'legacy_id'"
-        data = await cl.execute(queries.PROCESS_EXPENSE, variables)
-        return json.dumps(data.get("processExpense", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    variables: dict[str, Any] = {"action": params.action}
+    if params.id:
+        variables["id"] = params.id
+    if params.legacy_id:
+        variables["legacyId"] = params.legacy_id
+    if params.message:
+        variables["message"] = params.message
+    if not params.id and not params.legacy_id:
+        return "Error: Provide either 'id' or 'legacy_id'"
+    data = await _mutate(cl, queries.PROCESS_EXPENSE, variables, retry=False)
+    return _dump(data.get("processExpense", {}))
 
 
 # ---------------------------------------------------------------------------
@@ -1083,8 +1645,18 @@ async def oc_process_expense(params: ProcessExpenseInput, ctx=None) -> str:
 # ---------------------------------------------------------------------------
 
 
+_LIST_TRANSACTIONS_FIELDS = {
+    "transaction_type": "type",
+    "date_from": "dateFrom",
+    "date_to": "dateTo",
+    "search_term": "searchTerm",
+    "kind": "kind",
+}
+
+
 @mcp.tool(
     name="oc_list_transactions",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1096,35 +1668,27 @@ async def oc_process_expense(params: ProcessExpenseInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_list_transactions(params: ListTransactionsInput, ctx=None) -> str:
     """List transactions for an OpenCollective account (the ledger).
 
     Shows credits and debits with amounts, descriptions, linked expenses/orders.
     Supports filtering by type (CREDIT/DEBIT), date range, kind, and search term.
+
+    Returns NDJSON: a first line with totalCount/offset/limit, then one
+    transaction per line.
     """
-    try:
-        cl = _get_client(ctx)
-        variables: dict[str, Any] = {
-            "limit": params.limit,
-            "offset": params.offset,
-        }
-        if params.account_slug:
-            variables["account"] = [{"slug": params.account_slug}]
-        if params.transaction_type:
-            variables["type"] = params.transaction_type.upper()
-        if params.date_from:
-            variables["dateFrom"] = params.date_from
-        if params.date_to:
-            variables["dateTo"] = params.date_to
-        if params.search_term:
-            variables["searchTerm"] = params.search_term
-        if params.kind:
-            variables["kind"] = [k.upper() for k in params.kind]
-
-        data = await cl.execute(queries.LIST_TRANSACTIONS, variables)
-        return json.dumps(data.get("transactions", {}), indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    cl = _get_client(ctx)
+    variables: dict[str, Any] = {
+        "limit": params.limit,
+        "offset": params.offset,
+    }
+    if params.account_slug:
+        variables["account"] = [{"slug": params.account_slug}]
+    variables.update(_collect(params, _LIST_TRANSACTIONS_FIELDS, skip_empty=True))
+
+    data = await _execute(cl, queries.LIST_TRANSACTIONS, variables)
+    return _dump_ndjson(data.get("transactions") or {})
 
 
 # ---------------------------------------------------------------------------
@@ -1134,6 +1698,7 @@ async def oc_list_transactions(params: ListTransactionsInput, ctx=None) -> str:
 
 @mcp.tool(
     name="oc_execute_graphql",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1145,19 +1710,23 @@ async def oc_list_transactions(params: ListTransactionsInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def oc_execute_graphql(params: ExecuteGraphQLInput, ctx=None) -> str:
     """Execute a raw GraphQL query or mutation against the OpenCollective API v2.
 
     Use this as an escape hatch for operations not covered by other tools.
     The API endpoint is https://api.opencollective.com/graphql/v2.
     Authentication is applied automatically if OPENCOLLECTIVE_TOKEN is set.
+
+    Returns the API's JSON response unchanged: "data" plus any "errors".
     """
+    cl = _get_client(ctx)
     try:
-        cl = _get_client(ctx)
-        data = await cl.execute(params.query, params.variables)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+        raw = await cl.execute_raw(params.query, params.variables)
+    finally:
+        # May be a mutation, so treat it as one for the read cache
+        _invalidate_reads()
+    return raw.decode()
 
 
 # ---------------------------------------------------------------------------
@@ -1180,8 +1749,21 @@ def _get_hetzner_client(ctx) -> hetzner_client.HetznerClient:
     return _hetzner_client
 
 
+_MISSING_HETZNER_CREDENTIALS = "Error: HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD environment variables must be set."
+
+
+@functools.lru_cache(maxsize=1)
+def _hetzner_credentials() -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Hetzner email, password and customer number, read from the environment once."""
+    return (
+        os.environ.get("HETZNER_ACCOUNT_EMAIL"),
+        os.environ.get("HETZNER_ACCOUNT_PASSWORD"),
+        os.environ.get("HETZNER_CUSTOMER_NUMBER"),
+    )
+
+
 class HetznerListInvoicesInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     page: int = Field(default=1, ge=1, description="Page number")
     per_page: int = Field(
         default=25, ge=1, le=50, description="Items per page (max 50)"
@@ -1189,7 +1771,7 @@ class HetznerListInvoicesInput(BaseModel):
 
 
 class HetznerGetInvoiceInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     invoice_id: str = Field(..., description="Invoice ID", min_length=1)
 
 
@@ -1200,6 +1782,7 @@ class HetznerGetInvoiceInput(BaseModel):
 
 @mcp.tool(
     name="hetzner_list_invoices",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1211,26 +1794,24 @@ class HetznerGetInvoiceInput(BaseModel):
         },
     ),
 )
+@_guard
 async def hetzner_list_invoices(params: HetznerListInvoicesInput, ctx=None) -> str:
     """List invoices from Hetzner Cloud.
 
     Returns paginated invoice data. Requires HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD to be set.
     Uses browser automation to fetch invoices from accounts.hetzner.com.
     """
-    try:
-        email = os.environ.get("HETZNER_ACCOUNT_EMAIL")
-        password = os.environ.get("HETZNER_ACCOUNT_PASSWORD")
-        if not email or not password:
-            return "Error: HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD environment variables must be set."
-        cl = _get_hetzner_client(ctx)
-        data = await cl.list_invoices(page=params.page, per_page=params.per_page)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    email, password, _ = _hetzner_credentials()
+    if not email or not password:
+        return _MISSING_HETZNER_CREDENTIALS
+    cl = _get_hetzner_client(ctx)
+    data = await cl.list_invoices(page=params.page, per_page=params.per_page)
+    return _dump(data)
 
 
 @mcp.tool(
     name="hetzner_get_invoice",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1242,25 +1823,23 @@ async def hetzner_list_invoices(params: HetznerListInvoicesInput, ctx=None) -> s
         },
     ),
 )
+@_guard
 async def hetzner_get_invoice(params: HetznerGetInvoiceInput, ctx=None) -> str:
     """Get details of a specific Hetzner Cloud invoice by ID.
 
     Requires HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD to be set.
     """
-    try:
-        email = os.environ.get("HETZNER_ACCOUNT_EMAIL")
-        password = os.environ.get("HETZNER_ACCOUNT_PASSWORD")
-        if not email or not password:
-            return "Error: HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD environment variables must be set."
-        cl = _get_hetzner_client(ctx)
-        data = await cl.get_invoice(params.invoice_id)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    email, password, _ = _hetzner_credentials()
+    if not email or not password:
+        return _MISSING_HETZNER_CREDENTIALS
+    cl = _get_hetzner_client(ctx)
+    data = await cl.get_invoice(params.invoice_id)
+    return _dump(data)
 
 
 @mcp.tool(
     name="hetzner_get_latest_invoice",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1272,6 +1851,7 @@ async def hetzner_get_invoice(params: HetznerGetInvoiceInput, ctx=None) -> str:
         },
     ),
 )
+@_guard
 async def hetzner_get_latest_invoice(ctx=None) -> str:
     """Get the most recent Hetzner Cloud invoice.
 
@@ -1281,24 +1861,28 @@ async def hetzner_get_latest_invoice(ctx=None) -> str:
     Useful for automated monthly bookkeeping: fetch the latest Hetzner invoice
     and then use oc_create_expense to submit it to OpenCollective.
     """
-    try:
-        email = os.environ.get("HETZNER_ACCOUNT_EMAIL")
-        password = os.environ.get("HETZNER_ACCOUNT_PASSWORD")
-        if not email or not password:
-            return "Error: HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD environment variables must be set."
-        cl = _get_hetzner_client(ctx)
-        data = await cl.get_latest_invoice()
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    email, password, _ = _hetzner_credentials()
+    if not email or not password:
+        return _MISSING_HETZNER_CREDENTIALS
+    cl = _get_hetzner_client(ctx)
+    data = await cl.get_latest_invoice()
+    return _dump(data)
 
 
 class HetznerGetInvoicePdfInput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     invoice_id: str = Field(description="The invoice ID to download")
 
 
+class HetznerParseInvoicePdfInput(HetznerGetInvoicePdfInput):
+    include_raw_text: bool = Field(
+        default=False, description="Include the full extracted PDF text"
+    )
+
+
 @mcp.tool(
     name="hetzner_get_invoice_pdf",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1310,35 +1894,34 @@ class HetznerGetInvoicePdfInput(BaseModel):
         },
     ),
 )
+@_guard
 async def hetzner_get_invoice_pdf(params: HetznerGetInvoicePdfInput, ctx=None) -> str:
     """Download a Hetzner invoice as PDF.
 
     Returns the PDF content as base64-encoded string.
     Requires HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD to be set.
     """
-    try:
-        import base64
-
-        email = os.environ.get("HETZNER_ACCOUNT_EMAIL")
-        password = os.environ.get("HETZNER_ACCOUNT_PASSWORD")
-        if not email or not password:
-            return "Error: HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD environment variables must be set."
-        cl = _get_hetzner_client(ctx)
-        pdf_bytes = await cl.get_invoice_pdf(params.invoice_id)
-        b64 = base64.b64encode(pdf_bytes).decode("utf-8")
-        return json.dumps(
-            {
-                "invoice_id": params.invoice_id,
-                "content": b64,
-                "content_type": "application/pdf",
-            }
+    email, password, _ = _hetzner_credentials()
+    if not email or not password:
+        return _MISSING_HETZNER_CREDENTIALS
+    cl = _get_hetzner_client(ctx)
+    pdf_bytes = await cl.get_invoice_pdf(params.invoice_id)
+    # Compact, hand-built envelope: base64 is plain ASCII and needs no JSON
+    # escaping, so the encoded PDF is copied once instead of re-scanned
+    return b"".join(
+        (
+            b'{"invoice_id":',
+            orjson.dumps(params.invoice_id),
+            b',"content":"',
+            base64.b64encode(pdf_bytes),
+            b'","content_type":"application/pdf"}',
         )
-    except Exception as e:
-        return _handle_error(e)
+    ).decode("ascii")
 
 
 @mcp.tool(
     name="hetzner_parse_invoice_pdf",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1350,25 +1933,75 @@ async def hetzner_get_invoice_pdf(params: HetznerGetInvoicePdfInput, ctx=None) -
         },
     ),
 )
-async def hetzner_parse_invoice_pdf(params: HetznerGetInvoicePdfInput, ctx=None) -> str:
+@_cache_read
+@_guard
+async def hetzner_parse_invoice_pdf(
+    params: HetznerParseInvoicePdfInput, ctx=None
+) -> str:
     """Download and parse a Hetzner invoice PDF to JSON.
 
     Extracts invoice data like invoice number, date, amount, net, VAT, etc.
+    Set include_raw_text to also get the full extracted text.
     Requires HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD to be set.
     """
-    try:
-        email = os.environ.get("HETZNER_ACCOUNT_EMAIL")
-        password = os.environ.get("HETZNER_ACCOUNT_PASSWORD")
-        if not email or not password:
-            return "Error: HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD environment variables must be set."
-        cl = _get_hetzner_client(ctx)
-        data = await cl.get_invoice_pdf_parsed(params.invoice_id)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    email, password, _ = _hetzner_credentials()
+    if not email or not password:
+        return _MISSING_HETZNER_CREDENTIALS
+    cl = _get_hetzner_client(ctx)
+    data = await cl.get_invoice_pdf_parsed(
+        params.invoice_id, include_raw_text=params.include_raw_text
+    )
+    return _dump(data)
+
+
+@mcp.tool(
+    name="hetzner_get_invoice_pdf_bundle",
+    structured_output=False,
+    annotations=cast(
+        ToolAnnotations,
+        {
+            "title": "Download and Parse Hetzner Invoice PDF",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": True,
+        },
+    ),
+)
+@_guard
+async def hetzner_get_invoice_pdf_bundle(
+    params: HetznerParseInvoicePdfInput, ctx=None
+) -> str:
+    """Download a Hetzner invoice PDF and parse it in one call.
+
+    Returns the base64 PDF content together with the parsed invoice data,
+    downloading the PDF once instead of calling both hetzner_get_invoice_pdf
+    and hetzner_parse_invoice_pdf. Useful for attaching the PDF to an expense.
+    Requires HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD to be set.
+    """
+    email, password, _ = _hetzner_credentials()
+    if not email or not password:
+        return _MISSING_HETZNER_CREDENTIALS
+    cl = _get_hetzner_client(ctx)
+    pdf_bytes, parsed = await cl.get_invoice_pdf_bundle(
+        params.invoice_id, include_raw_text=params.include_raw_text
+    )
+    # Same hand-built envelope as hetzner_get_invoice_pdf, plus parsed data
+    return b"".join(
+        (
+            b'{"invoice_id":',
+            orjson.dumps(params.invoice_id),
+            b',"content":"',
+            base64.b64encode(pdf_bytes),
+            b'","content_type":"application/pdf","parsed":',
+            orjson.dumps(parsed, option=orjson.OPT_NON_STR_KEYS),
+            b"}",
+        )
+    ).decode()
 
 
 class HetznerGetInvoiceDetailsInput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
     usage_id: str = Field(
         description="The usage ID from the invoice (e.g., '7b65bc9a-6229-4019-99f8-31ef3e0ec8c6')"
     )
@@ -1376,6 +2009,7 @@ class HetznerGetInvoiceDetailsInput(BaseModel):
 
 @mcp.tool(
     name="hetzner_get_invoice_details",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1387,6 +2021,7 @@ class HetznerGetInvoiceDetailsInput(BaseModel):
         },
     ),
 )
+@_guard
 async def hetzner_get_invoice_details(
     params: HetznerGetInvoiceDetailsInput, ctx=None
 ) -> str:
@@ -1395,19 +2030,63 @@ async def hetzner_get_invoice_details(
     Fetches invoice line items as CSV from usage.hetzner.com.
     Requires HETZNER_ACCOUNT_EMAIL, HETZNER_ACCOUNT_PASSWORD, and HETZNER_CUSTOMER_NUMBER to be set.
     """
-    try:
-        email = os.environ.get("HETZNER_ACCOUNT_EMAIL")
-        password = os.environ.get("HETZNER_ACCOUNT_PASSWORD")
-        customer_number = os.environ.get("HETZNER_CUSTOMER_NUMBER")
-        if not email or not password:
-            return "Error: HETZNER_ACCOUNT_EMAIL and HETZNER_ACCOUNT_PASSWORD environment variables must be set."
-        if not customer_number:
-            return "Error: HETZNER_CUSTOMER_NUMBER environment variable must be set."
-        cl = _get_hetzner_client(ctx)
-        data = await cl.get_invoice_details(params.usage_id)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    email, password, customer_number = _hetzner_credentials()
+    if not email or not password:
+        return _MISSING_HETZNER_CREDENTIALS
+    if not customer_number:
+        return "Error: HETZNER_CUSTOMER_NUMBER environment variable must be set."
+    cl = _get_hetzner_client(ctx)
+    data = await cl.get_invoice_details(params.usage_id)
+    return _dump(data)
+
+
+class HetznerGetInvoiceDetailsBatchInput(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    usage_ids: list[str] = Field(
+        description="Usage IDs from the invoices, up to 25",
+        min_length=1,
+        max_length=25,
+    )
+
+
+@mcp.tool(
+    name="hetzner_get_invoice_details_batch",
+    structured_output=False,
+    annotations=cast(
+        ToolAnnotations,
+        {
+            "title": "Get Several Hetzner Invoice Details",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": True,
+        },
+    ),
+)
+@_guard
+async def hetzner_get_invoice_details_batch(
+    params: HetznerGetInvoiceDetailsBatchInput, ctx=None
+) -> str:
+    """Get detailed invoice information for several invoices at once.
+
+    Same data as hetzner_get_invoice_details, fetched concurrently with one
+    browser session. Returns one result per usage ID, in order:
+    {"details": ...} or {"error": ...} if that fetch failed.
+    Requires HETZNER_ACCOUNT_EMAIL, HETZNER_ACCOUNT_PASSWORD, and HETZNER_CUSTOMER_NUMBER to be set.
+    """
+    email, password, customer_number = _hetzner_credentials()
+    if not email or not password:
+        return _MISSING_HETZNER_CREDENTIALS
+    if not customer_number:
+        return "Error: HETZNER_CUSTOMER_NUMBER environment variable must be set."
+    cl = _get_hetzner_client(ctx)
+    results = await cl.get_invoice_details_batch(params.usage_ids)
+    return _dump(
+        [
+            {"error": _handle_error(r)} if isinstance(r, Exception) else {"details": r}
+            for r in results
+        ]
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -1434,8 +2113,6 @@ def _get_cloudflare_client(
         if _cloudflare_client._convert_to_eur == convert_to_eur:
             return _cloudflare_client
         # Settings don't match, close and recreate
-        import asyncio
-
         asyncio.create_task(_cloudflare_client.close())
         _cloudflare_client = None
 
@@ -1457,7 +2134,7 @@ def _get_cloudflare_client(
 
 
 class CloudflareListInvoicesInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     page: int = Field(default=1, ge=1, description="Page number")
     per_page: int = Field(
         default=25, ge=1, le=50, description="Items per page (max 50)"
@@ -1469,7 +2146,7 @@ class CloudflareListInvoicesInput(BaseModel):
 
 
 class CloudflareGetInvoiceInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     invoice_id: str = Field(..., description="Invoice ID", min_length=1)
     convert_to_eur: bool = Field(
         default=True,
@@ -1478,7 +2155,7 @@ class CloudflareGetInvoiceInput(BaseModel):
 
 
 class CloudflareGetLatestInvoiceInput(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
     convert_to_eur: bool = Field(
         default=True,
         description="Convert USD amounts to EUR using historical exchange rates",
@@ -1492,6 +2169,7 @@ class CloudflareGetLatestInvoiceInput(BaseModel):
 
 @mcp.tool(
     name="cloudflare_list_invoices",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1503,6 +2181,7 @@ class CloudflareGetLatestInvoiceInput(BaseModel):
         },
     ),
 )
+@_guard
 async def cloudflare_list_invoices(
     params: CloudflareListInvoicesInput, ctx=None
 ) -> str:
@@ -1523,19 +2202,17 @@ async def cloudflare_list_invoices(
     Requires CLOUDFLARE_API_TOKEN to be set.
     Uses the Cloudflare API (deprecated but functional /user/billing/history endpoint).
     """
-    try:
-        token = os.environ.get("CLOUDFLARE_API_TOKEN")
-        if not token:
-            return "Error: CLOUDFLARE_API_TOKEN environment variable must be set."
-        cl = _get_cloudflare_client(ctx, convert_to_eur=params.convert_to_eur)
-        data = await cl.list_invoices(page=params.page, per_page=params.per_page)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    token = os.environ.get("CLOUDFLARE_API_TOKEN")
+    if not token:
+        return "Error: CLOUDFLARE_API_TOKEN environment variable must be set."
+    cl = _get_cloudflare_client(ctx, convert_to_eur=params.convert_to_eur)
+    data = await cl.list_invoices(page=params.page, per_page=params.per_page)
+    return _dump(data)
 
 
 @mcp.tool(
     name="cloudflare_get_invoice",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1547,6 +2224,7 @@ async def cloudflare_list_invoices(
         },
     ),
 )
+@_guard
 async def cloudflare_get_invoice(params: CloudflareGetInvoiceInput, ctx=None) -> str:
     """Get details of a specific Cloudflare billing item by ID.
 
@@ -1563,19 +2241,17 @@ async def cloudflare_get_invoice(params: CloudflareGetInvoiceInput, ctx=None) ->
 
     Requires CLOUDFLARE_API_TOKEN to be set.
     """
-    try:
-        token = os.environ.get("CLOUDFLARE_API_TOKEN")
-        if not token:
-            return "Error: CLOUDFLARE_API_TOKEN environment variable must be set."
-        cl = _get_cloudflare_client(ctx, convert_to_eur=params.convert_to_eur)
-        data = await cl.get_invoice(params.invoice_id)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    token = os.environ.get("CLOUDFLARE_API_TOKEN")
+    if not token:
+        return "Error: CLOUDFLARE_API_TOKEN environment variable must be set."
+    cl = _get_cloudflare_client(ctx, convert_to_eur=params.convert_to_eur)
+    data = await cl.get_invoice(params.invoice_id)
+    return _dump(data)
 
 
 @mcp.tool(
     name="cloudflare_get_latest_invoice",
+    structured_output=False,
     annotations=cast(
         ToolAnnotations,
         {
@@ -1587,6 +2263,7 @@ async def cloudflare_get_invoice(params: CloudflareGetInvoiceInput, ctx=None) ->
         },
     ),
 )
+@_guard
 async def cloudflare_get_latest_invoice(
     params: CloudflareGetLatestInvoiceInput, ctx=None
 ) -> str:
@@ -1609,15 +2286,12 @@ async def cloudflare_get_latest_invoice(
     Useful for automated monthly bookkeeping: fetch the latest Cloudflare bill
     and then use oc_create_expense to submit it to OpenCollective.
     """
-    try:
-        token = os.environ.get("CLOUDFLARE_API_TOKEN")
-        if not token:
-            return "Error: CLOUDFLARE_API_TOKEN environment variable must be set."
-        cl = _get_cloudflare_client(ctx, convert_to_eur=params.convert_to_eur)
-        data = await cl.get_latest_invoice()
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return _handle_error(e)
+    token = os.environ.get("CLOUDFLARE_API_TOKEN")
+    if not token:
+        return "Error: CLOUDFLARE_API_TOKEN environment variable must be set."
+    cl = _get_cloudflare_client(ctx, convert_to_eur=params.convert_to_eur)
+    data = await cl.get_latest_invoice()
+    return _dump(data)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,96 @@
+"""Tests for the OpenCollective GraphQL client's persisted-query handling."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+
+from opencollective_mcp.client import GraphQLError, OpenCollectiveClient
+
+QUERY = 'query{account(slug:"x"){id}}'
+
+
+def _client(
+    handler: Callable[[dict[str, Any]], httpx.Response],
+) -> tuple[OpenCollectiveClient, list[dict[str, Any]]]:
+    """A client whose requests go to handler; also returns the sent payloads."""
+    sent: list[dict[str, Any]] = []
+
+    def transport(request: httpx.Request) -> httpx.Response:
+        payload = orjson.loads(request.content)
+        sent.append(payload)
+        return handler(payload)
+
+    client = OpenCollectiveClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+    return client, sent
+
+
+def test_server_without_apq_is_detected() -> None:
+    def handler(payload: dict[str, Any]) -> httpx.Response:
+        if "query" not in payload:
+            return httpx.Response(
+                400, json={"errors": [{"message": "Must provide query string."}]}
+            )
+        return httpx.Response(200, json={"data": {"account": {"id": "1"}}})
+
+    client, sent = _client(handler)
+
+    async def run() -> None:
+        assert await client.execute(QUERY) == {"account": {"id": "1"}}
+        assert client.persisted_queries is False
+        assert await client.execute(QUERY) == {"account": {"id": "1"}}
+
+    asyncio.run(run())
+    # Hash, full query, then straight to the full query
+    assert ["query" in payload for payload in sent] == [False, True, True]
+
+
+def test_bad_request_keeps_apq_enabled() -> None:
+    def handler(payload: dict[str, Any]) -> httpx.Response:
+        return httpx.Response(
+            400, json={"errors": [{"message": "Variable $slug is invalid"}]}
+        )
+
+    client, _ = _client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.execute(QUERY, {"slug": 1}))
+    assert client.persisted_queries is True
+
+
+def test_graphql_errors_on_retry_keep_apq_enabled() -> None:
+    def handler(payload: dict[str, Any]) -> httpx.Response:
+        if "query" not in payload:
+            return httpx.Response(400, json={"errors": [{"message": "Bad input"}]})
+        return httpx.Response(200, json={"errors": [{"message": "Bad input"}]})
+
+    client, _ = _client(handler)
+    with pytest.raises(GraphQLError):
+        asyncio.run(client.execute(QUERY))
+    assert client.persisted_queries is True
+
+
+def test_unknown_hash_registers_the_query() -> None:
+    def handler(payload: dict[str, Any]) -> httpx.Response:
+        if "query" not in payload:
+            return httpx.Response(
+                200,
+                json={
+                    "errors": [
+                        {
+                            "message": "PersistedQueryNotFound",
+                            "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                        }
+                    ]
+                },
+            )
+        return httpx.Response(200, json={"data": {"account": None}})
+
+    client, sent = _client(handler)
+    assert asyncio.run(client.execute(QUERY)) == {"account": None}
+    assert client.persisted_queries is True
+    assert sent[1]["query"] == QUERY
+    assert sent[1]["extensions"] == sent[0]["extensions"]